@@ -2,83 +2,82 @@
 MAIN.PY - ALX EHUB COURSE SCRAPER
 Professional scraper with authentication and course discovery
 """
+import os
 import sys
+import argparse
 import logging
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from alx_ehub_course_scraper.driver_manager import DriverManager
+from alx_ehub_course_scraper import get_config, get_driver_manager
 from alx_ehub_course_scraper.config import Config
 from alx_ehub_course_scraper.auth.login_manager import LoginManager, AuthStatus
 from alx_ehub_course_scraper.courses import CourseFinder, CourseList
+from alx_ehub_course_scraper.courses.models import STATUS_ICONS
+from alx_ehub_course_scraper.logging_setup import setup_logging
 
-def setup_logging():
-    """Configure logging for the entire application"""
-    
-    # Create logs directory
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+DEFAULT_OUTPUT_DIR = "data/course_lists"
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments
     
-    # Create log filename with timestamp
-    log_file = log_dir / f"scraper_{datetime.now().strftime('%Y%m%d')}.log"
+    Without --mode the scraper asks for a mode interactively, as before.
     
-    # Configure logging format
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    date_format = '%Y-%m-%d %H:%M:%S'
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
     
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="ALX eHub course scraper")
+    parser.add_argument(
+        "--mode",
+        choices=["discover", "auth", "interactive"],
+        help="Run this mode directly instead of showing the menu"
     )
-    
-    # Set third-party loggers to WARNING to reduce noise
-    logging.getLogger("selenium").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("webdriver_manager").setLevel(logging.WARNING)
-    
-    logger = logging.getLogger(__name__)
-    logger.info("=" * 60)
-    logger.info("LOGGING CONFIGURED SUCCESSFULLY")
-    logger.info(f"Log file: {log_file}")
-    logger.info("=" * 60)
-    
-    return logger
+    parser.add_argument(
+        "--no-inspect-wait",
+        action="store_true",
+        help="Never keep the browser open for manual inspection (overrides SCRAPER_INSPECT)"
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT_DIR,
+        metavar="DIR",
+        help=f"Directory for course list files (default: {DEFAULT_OUTPUT_DIR})"
+    )
+    return parser.parse_args(argv)
 
-def initialize_browser(config: Config, logger: logging.Logger) -> Optional[any]:
+def initialize_browser(config: Config, logger: logging.Logger, scraping_profile: bool = True) -> Optional[any]:
     """
     Initialize and start the browser
     
     Args:
         config: Config instance
         logger: Logger instance
+        scraping_profile: Launch with images/extensions disabled for scraping
     
     Returns:
         WebDriver instance or None if failed
     """
     try:
         print("\n🌐 Starting browser...")
-        driver_manager = DriverManager()
-        driver = driver_manager.get_driver(
+        driver = get_driver_manager().get_driver(
             browser=config.default_browser,
             headless=config.headless_mode,
-            stealth=config.data['browser_defaults']['stealth_mode']
+            stealth=config.stealth_mode,
+            scraping_profile=scraping_profile
         )
         logger.info(f"Browser started successfully: {config.default_browser}")
         return driver
     except Exception as e:
-        logger.error(f"Failed to start browser: {e}")
-        print(f"❌ Failed to start browser: {e}")
+        logger.error(f"Failed to start browser: {e}", extra={'ui': "❌"})
         return None
 
 def authenticate(driver, config: Config, logger: logging.Logger) -> Optional[LoginManager]:
@@ -98,9 +97,8 @@ def authenticate(driver, config: Config, logger: logging.Logger) -> Optional[Log
     
     try:
         # Initialize login manager
-        print("🔑 Initializing LoginManager...")
-        login_manager = LoginManager(driver, config.data)
-        logger.info("LoginManager initialized")
+        login_manager = LoginManager(driver, config)
+        logger.info("LoginManager initialized", extra={'ui': "🔑"})
         
         # Perform authentication
         print("\n🔄 Checking login status...")
@@ -108,14 +106,12 @@ def authenticate(driver, config: Config, logger: logging.Logger) -> Optional[Log
         
         # Handle result
         if auth_result.status in [AuthStatus.SESSION_RESTORED, AuthStatus.AUTHENTICATED]:
-            print(f"\n✅ {auth_result.message}")
+            logger.info(f"{auth_result.message} ({auth_result.status.value})", extra={'ui': "\n✅"})
             if auth_result.user_id:
                 print(f"   User ID: {auth_result.user_id}")
             if auth_result.session_file:
                 print(f"   Session: {auth_result.session_file}")
             
-            logger.info(f"Authentication successful: {auth_result.status.value}")
-            
             # List saved sessions
             print("\n📊 Active sessions:")
             sessions = login_manager.session_manager.list_sessions()
@@ -127,16 +123,15 @@ def authenticate(driver, config: Config, logger: logging.Logger) -> Optional[Log
             
             return login_manager
         else:
-            print(f"\n❌ Authentication failed: {auth_result.message}")
-            logger.error(f"Authentication failed: {auth_result.message}")
+            logger.error(f"Authentication failed: {auth_result.message}", extra={'ui': "\n❌"})
             return None
             
     except Exception as e:
-        logger.exception("Error during authentication")
-        print(f"\n❌ Authentication error: {e}")
+        logger.exception(f"Authentication error: {e}", extra={'ui': "\n❌"})
         return None
 
-def test_course_discovery(driver, config: Config, logger: logging.Logger) -> bool:
+def test_course_discovery(driver, config: Config, logger: logging.Logger,
+                          output_dir: str = DEFAULT_OUTPUT_DIR) -> bool:
     """
     Test course discovery functionality
     
@@ -144,6 +139,7 @@ def test_course_discovery(driver, config: Config, logger: logging.Logger) -> boo
         driver: WebDriver instance
         config: Config instance
         logger: Logger instance
+        output_dir: Directory the course list file is written to
     
     Returns:
         bool: True if course discovery successful
@@ -153,31 +149,33 @@ def test_course_discovery(driver, config: Config, logger: logging.Logger) -> boo
     
     try:
         # Initialize course finder
-        print("🔍 Initializing CourseFinder...")
-        course_finder = CourseFinder(driver, config.data)
-        logger.info("CourseFinder initialized")
+        course_finder = CourseFinder(driver, config)
+        logger.info("CourseFinder initialized", extra={'ui': "🔍"})
         
         # Discover courses
         print("\n🔄 Discovering courses...")
         courses = course_finder.find_all_courses(save_debug=True)
         
         # Print summary
-        print(f"\n✅ Found {len(courses)} courses total")
-        print(f"   Accessible: {len(courses.accessible_courses())}")
-        print(f"   Completed: {len(courses.by_status('Completed'))}")
-        print(f"   In Progress: {len(courses.by_status('In Progress'))}")
+        summary = courses.summary()
+        print(f"\n✅ Found {summary['total']} courses total")
+        print(f"   Accessible: {summary['accessible']}")
+        print(f"   Completed: {summary['Completed']}")
+        print(f"   In Progress: {summary['In Progress']}")
         
         # Print detailed list
-        print("\n📋 Course List:")
+        # Build the whole list first - one write instead of one per course
+        lines = ["\n📋 Course List:"]
         for i, course in enumerate(courses, 1):
-            status_icon = "✅" if course.status == "Completed" else "🔄" if course.status == "In Progress" else "⏳"
+            status_icon = STATUS_ICONS.get(course.status, "⏳")
             accessible_icon = "🔗" if course.is_accessible else "🚫"
-            print(f"   {i}. {accessible_icon} {status_icon} {course.name}")
+            lines.append(f"   {i}. {accessible_icon} {status_icon} {course.name}")
             if course.full_url:
-                print(f"       URL: {course.full_url}")
+                lines.append(f"       URL: {course.full_url}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Save to file
-        output_dir = Path("data/course_lists")
+        output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"courses_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         courses.save_to_file(str(output_file))
@@ -187,11 +185,12 @@ def test_course_discovery(driver, config: Config, logger: logging.Logger) -> boo
         return True
         
     except Exception as e:
-        logger.exception("Error during course discovery")
-        print(f"\n❌ Course discovery failed: {e}")
+        logger.exception(f"Course discovery failed: {e}", extra={'ui': "\n❌"})
         return False
 
-def run_interactive_mode(driver, config: Config, logger: logging.Logger):
+def run_interactive_mode(driver, config: Config, logger: logging.Logger,
+                         login_manager: Optional[LoginManager] = None,
+                         output_dir: str = DEFAULT_OUTPUT_DIR):
     """
     Run interactive mode with menu
     
@@ -199,7 +198,11 @@ def run_interactive_mode(driver, config: Config, logger: logging.Logger):
         driver: WebDriver instance
         config: Config instance
         logger: Logger instance
+        login_manager: Authenticated LoginManager to reuse (created if None)
+        output_dir: Directory course list files are written to
     """
+    login_manager = login_manager or LoginManager(driver, config)
+    
     while True:
         print("\n" + "="*60)
         print("🎯 ALX EHUB SCRAPER - INTERACTIVE MODE")
@@ -214,11 +217,10 @@ def run_interactive_mode(driver, config: Config, logger: logging.Logger):
         choice = input("\nEnter choice (1-5): ").strip()
         
         if choice == "1":
-            test_course_discovery(driver, config, logger)
+            test_course_discovery(driver, config, logger, output_dir=output_dir)
             
         elif choice == "2":
             print("\n📊 SAVED SESSIONS:")
-            login_manager = LoginManager(driver, config.data)
             sessions = login_manager.session_manager.list_sessions()
             if sessions:
                 for session in sessions:
@@ -229,7 +231,6 @@ def run_interactive_mode(driver, config: Config, logger: logging.Logger):
                 print("   No saved sessions found")
                 
         elif choice == "3":
-            login_manager = LoginManager(driver, config.data)
             if login_manager.logout():
                 print("✅ Session cleared")
             else:
@@ -237,7 +238,6 @@ def run_interactive_mode(driver, config: Config, logger: logging.Logger):
                 
         elif choice == "4":
             print("\n🔄 Re-authenticating...")
-            login_manager = LoginManager(driver, config.data)
             result = login_manager.ensure_logged_in()
             if result.status in [AuthStatus.AUTHENTICATED, AuthStatus.SESSION_RESTORED]:
                 print(f"✅ {result.message}")
@@ -250,10 +250,17 @@ def run_interactive_mode(driver, config: Config, logger: logging.Logger):
         else:
             print("❌ Invalid choice")
 
-def main():
-    """Main entry point"""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
+    args = parse_args(argv)
+    
     # Setup logging
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     
     print("\n" + "="*60)
     print("🎯 ALX EHUB COURSE SCRAPER")
@@ -261,7 +268,7 @@ def main():
     
     # Initialize config
     logger.info("Loading configuration")
-    config = Config()
+    config = get_config()
     
     # Initialize browser
     driver = initialize_browser(config, logger)
@@ -278,29 +285,37 @@ def main():
         
         print("\n✨ Authentication successful! Ready to scrape.")
         
-        # Ask user what to do next
-        print("\n" + "="*60)
-        print("🎯 SELECT MODE:")
-        print("="*60)
-        print("1. Quick Course Discovery Test")
-        print("2. Interactive Mode (Menu)")
-        print("3. Exit")
-        print("="*60)
+        if args.mode == "auth":
+            return
         
-        choice = input("\nEnter choice (1-3): ").strip()
+        # Ask user what to do next, unless --mode already decided
+        if args.mode == "discover":
+            choice = "1"
+        elif args.mode == "interactive":
+            choice = "2"
+        else:
+            print("\n" + "="*60)
+            print("🎯 SELECT MODE:")
+            print("="*60)
+            print("1. Quick Course Discovery Test")
+            print("2. Interactive Mode (Menu)")
+            print("3. Exit")
+            print("="*60)
+            
+            choice = input("\nEnter choice (1-3): ").strip()
         
         if choice == "1":
             # Quick course discovery test
-            test_course_discovery(driver, config, logger)
+            test_course_discovery(driver, config, logger, output_dir=args.output)
             
-            # Keep browser open
-            print("\n⏱️  Browser will stay open for 30 seconds...")
-            logger.info("Waiting for manual inspection")
-            time.sleep(30)
+            # Keep browser open for manual inspection (opt-in)
+            if os.getenv('SCRAPER_INSPECT') == '1' and not args.no_inspect_wait:
+                logger.info("Browser will stay open for 30 seconds for manual inspection", extra={'ui': "\n⏱️ "})
+                time.sleep(30)
             
         elif choice == "2":
             # Interactive mode
-            run_interactive_mode(driver, config, logger)
+            run_interactive_mode(driver, config, logger, login_manager, output_dir=args.output)
             
         elif choice == "3":
             print("\n👋 Exiting...")
@@ -309,18 +324,15 @@ def main():
             print("❌ Invalid choice. Exiting.")
         
     except KeyboardInterrupt:
-        print("\n\n👋 Interrupted by user. Exiting...")
-        logger.info("Application interrupted by user")
+        logger.info("Interrupted by user. Exiting...", extra={'ui': "\n\n👋"})
         
     except Exception as e:
-        logger.exception("Fatal error in main")
-        print(f"\n💥 Fatal error: {e}")
+        logger.exception(f"Fatal error: {e}", extra={'ui': "\n💥"})
         
     finally:
         if driver:
             driver.quit()
-            logger.info("Browser closed")
-            print("\n🧹 Browser closed. Goodbye!")
+            logger.info("Browser closed. Goodbye!", extra={'ui': "\n🧹"})
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
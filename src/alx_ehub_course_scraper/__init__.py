@@ -0,0 +1,38 @@
+"""
+ALX eHub course scraper
+Shared Config and DriverManager instances for the entry scripts
+"""
+from typing import Optional
+
+from .config import Config
+from .driver_manager import DriverManager
+
+# Created on first use - reading config files and the driver cache happens once per process
+_config_singleton: Optional[Config] = None
+_driver_manager_singleton: Optional[DriverManager] = None
+
+def get_config() -> Config:
+    """
+    Get the process-wide Config instance
+    
+    Returns:
+        Config instance (call .reload() to re-read files)
+    """
+    global _config_singleton
+    if _config_singleton is None:
+        _config_singleton = Config()
+    return _config_singleton
+
+def get_driver_manager() -> DriverManager:
+    """
+    Get the process-wide DriverManager, sharing the Config from get_config()
+    
+    Returns:
+        DriverManager instance
+    """
+    global _driver_manager_singleton
+    if _driver_manager_singleton is None:
+        _driver_manager_singleton = DriverManager(get_config())
+    return _driver_manager_singleton
+
+__all__ = ['Config', 'DriverManager', 'get_config', 'get_driver_manager']
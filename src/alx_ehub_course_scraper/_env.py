@@ -0,0 +1,77 @@
+"""
+.env loading
+Reads the project's .env file once per process (reload_env() re-reads it)
+"""
+import os
+import re
+import functools
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+# KEY=value lines, optionally quoted; comments, blanks and anything else are skipped
+_ENV_LINE = re.compile(rb'(?m)^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*\r?$')
+
+# In an unquoted value, whitespace followed by # starts a comment (as in python-dotenv)
+_INLINE_COMMENT = re.compile(r'\s+#')
+
+# Working directory first (like python-dotenv), then the project root
+_ENV_FILES = (Path(".env"), Path(__file__).parent.parent.parent / ".env")
+
+# Variables this module put into os.environ, so a re-read can update them
+_applied: Dict[str, str] = {}
+
+def _parse_value(raw: str) -> str:
+    """
+    Value of one KEY=value line
+    
+    A value wrapped in a matching pair of quotes is taken verbatim from
+    inside them (anything after the closing quote is ignored). Otherwise
+    an inline comment is dropped, and quote characters are kept as-is.
+    """
+    if len(raw) >= 2 and raw[0] in '"\'':
+        end = raw.find(raw[0], 1)
+        if end != -1:
+            return raw[1:end]
+    return _INLINE_COMMENT.split(raw, 1)[0]
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> Mapping[str, str]:
+    """
+    Load variables from .env into os.environ
+    
+    Variables already set in the environment win, as with load_dotenv(),
+    unless they were set by an earlier read of .env. Only the first call
+    reads the file - later calls return the cached result.
+    
+    Returns:
+        Read-only mapping of the values parsed from .env
+    """
+    values = {}
+    for env_file in _ENV_FILES:
+        if env_file.is_file():
+            for key, value in _ENV_LINE.findall(env_file.read_bytes()):
+                values[key.decode()] = _parse_value(value.decode("utf-8"))
+            break
+    
+    # Drop variables an earlier read set that are no longer in .env
+    for key in [key for key in _applied if key not in values]:
+        if os.environ.get(key) == _applied.pop(key):
+            del os.environ[key]
+    
+    for key, value in values.items():
+        if key not in os.environ or os.environ[key] == _applied.get(key):
+            os.environ[key] = value
+            _applied[key] = value
+    
+    return MappingProxyType(values)
+
+def reload_env() -> Mapping[str, str]:
+    """
+    Re-read .env, updating the variables earlier reads set
+    
+    Returns:
+        Read-only mapping of the values parsed from .env
+    """
+    load_env.cache_clear()
+    return load_env()
@@ -2,15 +2,15 @@
 Login Manager for ALX ehub
 Handles authentication with per-user session management
 """
-import pickle
 import os
-import json
 import logging
 import hashlib
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -18,11 +18,113 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from dotenv import load_dotenv
+from .._env import load_env
+import orjson
+
+from ..config import Config
+from ..page_capture import save_page_snapshot, save_screenshot_async, SCREENSHOT_TIMEOUT
 
 # Create a logger for your module
 logger = logging.getLogger(__name__)
 
+# Logged-in indicators (and the login form), keyed as in AUTH_PROBE_SCRIPT
+AUTH_INDICATORS = {
+    'notification': "svg circle[fill='#FF6B5E']",
+    'profile': "img[src*='profilePhoto']",
+    'greeting': "p.flex.text-3xl.font-bold",
+    'points': "span.font-bold.text-sm.text-card-foreground",
+    'login_form': "form.space-y-4",
+}
+
+# First match for each logged-in indicator, queried in-browser in one call
+# (querySelector stops at the first hit, like find_element)
+AUTH_PROBE_SCRIPT = """
+const probe = (selector) => {
+    const el = document.querySelector(selector);
+    if (!el) return null;
+    return {
+        text: (el.innerText || '').trim(),
+        src: el.getAttribute('src') || '',
+        visible: el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden'
+    };
+};
+return {
+    notification: probe("svg circle[fill='#FF6B5E']"),
+    profile: probe("img[src*='profilePhoto']"),
+    greeting: probe("p.flex.text-3xl.font-bold"),
+    points: probe("span.font-bold.text-sm.text-card-foreground"),
+    login_form: probe("form.space-y-4")
+};
+"""
+
+# Attributes of every input on the login page, for debug logging
+LOGIN_INPUTS_SCRIPT = """
+return Array.from(document.querySelectorAll('input')).map(i => ({
+    type: i.getAttribute('type'),
+    name: i.getAttribute('name'),
+    id: i.getAttribute('id'),
+    class: i.getAttribute('class')
+}));
+"""
+
+@functools.lru_cache(maxsize=64)
+def _user_id(email: str) -> str:
+    """Stable 12-character user id derived from the email"""
+    return hashlib.blake2b(email.encode(), digest_size=6).hexdigest()
+
+# Tried when the configured login field selectors don't match
+EMAIL_FALLBACK_SELECTORS = ("input[type='text'][placeholder*='email']", "#:r0:-form-item")
+PASSWORD_FALLBACK_SELECTORS = ("input[type='password']", "#:r1:-form-item")
+
+# First visible element per field from arguments[0] = {field: [selectors]}
+LOGIN_FIELDS_SCRIPT = """
+const visible = (el) => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+const first = (selectors) => {
+    for (const selector of selectors) {
+        let el = null;
+        try { el = document.querySelector(selector); } catch (e) { continue; }
+        if (el && visible(el)) return el;
+    }
+    return null;
+};
+const found = {};
+for (const [name, selectors] of Object.entries(arguments[0])) {
+    found[name] = first(selectors);
+}
+if (!found.submit) {
+    found.submit = Array.from(document.querySelectorAll('button'))
+        .find(b => b.textContent.includes('Sign in')) || null;
+}
+return found;
+"""
+
+def _split_selectors(selector: str) -> Tuple[str, ...]:
+    """Split a comma-separated selector list from config into single selectors"""
+    return tuple(part.strip() for part in selector.split(',') if part.strip())
+
+def _to_cdp_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a Selenium cookie dict to a CDP Network.CookieParam"""
+    cdp_cookie = {
+        'name': cookie['name'],
+        'value': cookie['value'],
+        'domain': cookie.get('domain'),
+        'path': cookie.get('path', '/'),
+        'secure': cookie.get('secure', False),
+        'httpOnly': cookie.get('httpOnly', False),
+    }
+    if 'expiry' in cookie:
+        cdp_cookie['expires'] = cookie['expiry']
+    if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+        cdp_cookie['sameSite'] = cookie['sameSite']
+    return cdp_cookie
+
+def _read_metadata(metadata_file: Path) -> Optional[Dict[str, Any]]:
+    """Parse a session metadata file, or None if it can't be read"""
+    try:
+        return orjson.loads(metadata_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
 class AuthStatus(Enum):
     """Authentication status enum"""
     AUTHENTICATED = "authenticated"
@@ -31,7 +133,7 @@ class AuthStatus(Enum):
     INVALID_CREDENTIALS = "invalid_credentials"
     SESSION_EXPIRED = "session_expired"
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Session metadata"""
     user_id: str
@@ -39,13 +141,16 @@ class SessionInfo:
     created_at: str
     last_used: str
     expires_at: str
+    # Parsed expires_at, set on first is_expired() (orjson skips _-prefixed fields)
+    _expires_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
     
     def is_expired(self) -> bool:
         """Check if session is expired"""
-        expires = datetime.fromisoformat(self.expires_at)
-        return datetime.now() > expires
+        if self._expires_dt is None:
+            self._expires_dt = datetime.fromisoformat(self.expires_at)
+        return datetime.now() > self._expires_dt
 
-@dataclass
+@dataclass(slots=True)
 class AuthResult:
     """Authentication result"""
     status: AuthStatus
@@ -62,27 +167,51 @@ class LoginManager:
     Main authentication manager with per-user session handling
     """
     
-    def __init__(self, driver: WebDriver, config: Dict[str, Any]):
+    def __init__(self, driver: WebDriver, config: Config):
         self.driver = driver
         self.config = config
-        self.session_manager = SessionManager()
+        session_config = config.auth_config.get('session', {})
+        self.session_manager = SessionManager(
+            archive=session_config.get('archive', False),
+            max_archives=session_config.get('max_archives', MAX_SESSION_ARCHIVES)
+        )
         
-        # Load credentials
-        load_dotenv()
-        self.email = os.getenv('ALX_EMAIL')
-        self.password = os.getenv('ALX_PASSWORD')
+        # Load credentials (real environment variables take precedence over .env)
+        env = load_env()
+        self.email = os.environ.get('ALX_EMAIL') or env.get('ALX_EMAIL')
+        self.password = os.environ.get('ALX_PASSWORD') or env.get('ALX_PASSWORD')
         
         if not self.email or not self.password:
             raise LoginError("ALX_EMAIL and ALX_PASSWORD must be set in .env")
         
         # Get auth config
-        self.auth_config = config.get('auth', {})
+        self.auth_config = config.auth_config
         self.timeouts = self.auth_config.get('timeouts', {
             'page_load': 10,
             'element_wait': 10,
             'post_login_wait': 3
         })
         
+        # Waits are reused across login attempts rather than built per call
+        self._element_wait = WebDriverWait(self.driver, self.timeouts.get('element_wait', 10))
+        self._post_login_wait = WebDriverWait(self.driver, self.timeouts.get('post_login_wait', 5))
+        
+        # Resolve login selectors once instead of walking the config per call
+        selectors = self.auth_config.get('selectors', {})
+        form_selectors = selectors.get('login_form', {})
+        self._sel_form = form_selectors.get('form', 'form.space-y-4')
+        self._sel_email = form_selectors.get('email', "input[name='email']")
+        self._sel_pw = form_selectors.get('password', "input[name='password']")
+        self._sel_submit = form_selectors.get('submit', "button[type='submit']")
+        self._sel_indicators = tuple(selectors.get('login_page_indicators', []))
+        
+        # Selector lists per login field, in the order they are tried
+        self._field_candidates = {
+            'email': [*_split_selectors(self._sel_email), *EMAIL_FALLBACK_SELECTORS],
+            'password': [*_split_selectors(self._sel_pw), *PASSWORD_FALLBACK_SELECTORS],
+            'submit': list(_split_selectors(self._sel_submit)),
+        }
+        
         logger.info(f"LoginManager initialized for user: {self.email}")
     
     def ensure_logged_in(self) -> AuthResult:
@@ -98,7 +227,8 @@ class LoginManager:
         if session_info:
             logger.info(f"Session loaded for {self.email} (created: {session_info.created_at})")
             
-            # Step 2: Verify session works
+            # Step 2: Verify session works (once the page has rendered)
+            self._wait_for_session_page()
             if self._is_authenticated():
                 return AuthResult(
                     status=AuthStatus.SESSION_RESTORED,
@@ -117,58 +247,50 @@ class LoginManager:
     def _is_authenticated(self) -> bool:
         """Check if current session is authenticated"""
         current_url = self.driver.current_url.lower()
-        page_source = self.driver.page_source.lower()
         
         # If we're on login page, definitely not authenticated
         if 'login' in current_url or 'signin' in current_url:
             logger.debug("On login page - not authenticated")
             return False
         
-        # METHOD 1: Check for user profile image (STRONGEST indicator)
+        # All indicators in one round-trip to the driver
         try:
-            profile_images = self.driver.find_elements(By.CSS_SELECTOR, "img[src*='profilePhoto']")
-            if profile_images and profile_images[0].is_displayed():
-                logger.debug("✅ Found profile image - authenticated")
-                return True
+            probe = self._probe_page()
         except Exception as e:
-            logger.debug(f"Profile image check failed: {e}")
+            # Fall back to one lookup per indicator - a failed lookup only skips that method
+            logger.debug(f"Authentication probe failed, checking indicators one by one: {e}")
+            probe = self._probe_page_by_element()
+        
+        # Cheapest indicators first - any positive match ends the check
+        # METHOD 1: Check for notification bell with red circle
+        if probe.get('notification'):
+            logger.debug("✅ Found notification bell - authenticated")
+            return True
         
-        # METHOD 2: Check for greeting with name
-        try:
-            greeting = self.driver.find_elements(By.CSS_SELECTOR, "p.flex.text-3xl.font-bold")
-            if greeting and greeting[0].is_displayed() and "Hello" in greeting[0].text:
-                logger.debug(f"✅ Found greeting: {greeting[0].text} - authenticated")
-                return True
-        except Exception as e:
-            logger.debug(f"Greeting check failed: {e}")
+        # METHOD 2: Check for user profile image (STRONGEST indicator)
+        # Presence only - with images blocked the <img> may never render
+        profile = probe.get('profile')
+        if profile:
+            logger.debug("✅ Found profile image - authenticated")
+            return True
         
-        # METHOD 3: Check for points display
-        try:
-            points = self.driver.find_elements(By.CSS_SELECTOR, "span.font-bold.text-sm.text-card-foreground")
-            if points and points[0].is_displayed() and points[0].text.isdigit():
-                logger.debug(f"✅ Found points: {points[0].text} - authenticated")
-                return True
-        except Exception as e:
-            logger.debug(f"Points check failed: {e}")
+        # METHOD 3: Check for greeting with name
+        greeting = probe.get('greeting')
+        if greeting and greeting['visible'] and "Hello" in greeting['text']:
+            logger.debug(f"✅ Found greeting: {greeting['text']} - authenticated")
+            return True
         
-        # METHOD 4: Check for notification bell with red circle
-        try:
-            notification = self.driver.find_elements(By.CSS_SELECTOR, "svg circle[fill='#FF6B5E']")
-            if notification:
-                logger.debug("✅ Found notification bell - authenticated")
-                return True
-        except Exception as e:
-            logger.debug(f"Notification check failed: {e}")
+        # METHOD 4: Check for points display
+        points = probe.get('points')
+        if points and points['visible'] and points['text'].isdigit():
+            logger.debug(f"✅ Found points: {points['text']} - authenticated")
+            return True
         
         # METHOD 5: Check for absence of login form (fallback)
-        try:
-            login_forms = self.driver.find_elements(By.CSS_SELECTOR, "form.space-y-4")
-            if not login_forms:
-                # If no login form and we're not on login page, assume authenticated
-                logger.debug("No login form found - assuming authenticated")
-                return True
-        except:
-            pass
+        if 'login_form' in probe and not probe['login_form']:
+            # If no login form and we're not on login page, assume authenticated
+            logger.debug("No login form found - assuming authenticated")
+            return True
         
         logger.debug("No authentication indicators found")
         return False
@@ -185,49 +307,14 @@ class LoginManager:
             logger.info(f"Navigating to {login_url}")
             self.driver.get(login_url)
             
-            # Wait for page to load
-            import time
-            time.sleep(2)
+            # Wait for form (returns as soon as the page has rendered it)
+            form_ready = self._wait_for_login_form()
             
-            # === CAPTURE LOGIN PAGE FOR ANALYSIS ===
-            try:
-                # Create login_pages directory
-                login_pages_dir = Path("data/login_pages")
-                login_pages_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Create filename with timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                html_file = login_pages_dir / f"login_page_{timestamp}.html"
-                screenshot_file = login_pages_dir / f"login_page_{timestamp}.png"
-                
-                # Save HTML
-                with open(html_file, "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-                logger.info(f"📄 Login page HTML saved: {html_file}")
-                
-                # Save screenshot
-                self.driver.save_screenshot(str(screenshot_file))
-                logger.info(f"📸 Login page screenshot saved: {screenshot_file}")
-                
-                # Log all input fields found
-                inputs = self.driver.find_elements(By.CSS_SELECTOR, "input")
-                logger.debug(f"Found {len(inputs)} input fields on login page:")
-                for i, inp in enumerate(inputs):
-                    try:
-                        input_type = inp.get_attribute("type")
-                        input_name = inp.get_attribute("name")
-                        input_id = inp.get_attribute("id")
-                        input_class = inp.get_attribute("class")
-                        logger.debug(f"  Input {i+1}: type={input_type}, name={input_name}, id={input_id}, class={input_class}")
-                    except:
-                        pass
-                        
-            except Exception as e:
-                logger.warning(f"Could not save login page for analysis: {e}")
-            # === END CAPTURE ===
+            # === CAPTURE LOGIN PAGE FOR ANALYSIS (opt-in) ===
+            if os.getenv('ALX_CAPTURE_LOGIN') == '1' or logger.isEnabledFor(logging.DEBUG):
+                self._capture_login_page()
             
-            # Wait for form
-            if not self._wait_for_login_form():
+            if not form_ready:
                 return AuthResult(
                     status=AuthStatus.LOGIN_FAILED,
                     message="Login form not found"
@@ -247,8 +334,14 @@ class LoginManager:
                     message="Could not submit login form"
                 )
             
-            # Wait for redirect and page load
-            time.sleep(self.timeouts.get('post_login_wait', 5))
+            # Wait for redirect away from login, or the dashboard's profile image
+            try:
+                self._post_login_wait.until(
+                    lambda d: 'login' not in d.current_url.lower()
+                    or d.find_elements(By.CSS_SELECTOR, "img[src*='profilePhoto']")
+                )
+            except TimeoutException:
+                logger.debug("No post-login redirect within post_login_wait")
             
             # Verify login
             if self._is_authenticated():
@@ -280,59 +373,114 @@ class LoginManager:
         user_info = {}
         
         try:
-            # Get user name from greeting
-            greeting = self.driver.find_elements(By.CSS_SELECTOR, "p.flex.text-3xl.font-bold")
-            if greeting:
-                # Extract name from "Hello Name!"
-                text = greeting[0].text
-                if "Hello" in text:
-                    user_info['name'] = text.replace("Hello", "").replace("!", "").strip()
-        except:
-            pass
+            probe = self._probe_page()
+        except Exception as e:
+            logger.debug(f"User info probe failed: {e}")
+            return user_info
         
-        try:
-            # Get user points
-            points = self.driver.find_elements(By.CSS_SELECTOR, "span.font-bold.text-sm.text-card-foreground")
-            if points and points[0].text.isdigit():
-                user_info['points'] = points[0].text
-        except:
-            pass
+        # Get user name from greeting ("Hello Name!")
+        greeting = probe.get('greeting')
+        if greeting and "Hello" in greeting['text']:
+            user_info['name'] = greeting['text'].replace("Hello", "").replace("!", "").strip()
         
-        try:
-            # Get profile image URL
-            profile_img = self.driver.find_elements(By.CSS_SELECTOR, "img[src*='profilePhoto']")
-            if profile_img:
-                user_info['profile_image'] = profile_img[0].get_attribute('src')
-        except:
-            pass
+        # Get user points
+        points = probe.get('points')
+        if points and points['text'].isdigit():
+            user_info['points'] = points['text']
+        
+        # Get profile image URL
+        profile = probe.get('profile')
+        if profile:
+            user_info['profile_image'] = profile['src']
         
         return user_info
     
+    def _probe_page(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Look up every logged-in indicator with a single script execution
+        
+        Returns:
+            Dict of indicator name -> {text, src, visible}, or None if absent
+        """
+        return self.driver.execute_script(AUTH_PROBE_SCRIPT) or {}
+    
+    def _probe_page_by_element(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Same result as _probe_page, one find_elements call per indicator
+        
+        Returns:
+            Dict of indicator name -> {text, src, visible}; indicators whose
+            lookup failed are left out
+        """
+        probe = {}
+        for name, selector in AUTH_INDICATORS.items():
+            try:
+                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                el = elements[0] if elements else None
+                probe[name] = el and {
+                    'text': el.text.strip(),
+                    'src': el.get_attribute('src') or '',
+                    'visible': el.is_displayed()
+                }
+            except Exception as e:
+                logger.debug(f"{name} check failed: {e}")
+        return probe
+    
+    def _wait_for_session_page(self) -> None:
+        """Wait for the dashboard or the login form after a session is loaded"""
+        # With the eager page-load strategy driver.get returns before the app renders
+        selector = ", ".join([AUTH_INDICATORS['profile'], AUTH_INDICATORS['greeting'], self._sel_form])
+        try:
+            self._post_login_wait.until(
+                lambda d: 'login' in d.current_url.lower()
+                or d.find_elements(By.CSS_SELECTOR, selector)
+            )
+        except TimeoutException:
+            logger.debug("Neither dashboard nor login form rendered within post_login_wait")
+    
+    def _capture_login_page(self) -> None:
+        """Save the login page HTML and screenshot, and log its input fields"""
+        try:
+            # Create login_pages directory
+            login_pages_dir = Path("data/login_pages")
+            login_pages_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Create filename with timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            
+            # Start screenshot in the background while the HTML is saved
+            screenshot_future = save_screenshot_async(self.driver, login_pages_dir / f"login_page_{timestamp}")
+            
+            # Save HTML
+            html_file = save_page_snapshot(self.driver, login_pages_dir / f"login_page_{timestamp}")
+            logger.info(f"📄 Login page HTML saved: {html_file}")
+            
+            # Log all input fields found - one script call for every attribute
+            inputs = self.driver.execute_script(LOGIN_INPUTS_SCRIPT) or []
+            logger.debug(f"Found {len(inputs)} input fields on login page:")
+            for i, inp in enumerate(inputs):
+                logger.debug(f"  Input {i+1}: type={inp['type']}, name={inp['name']}, id={inp['id']}, class={inp['class']}")
+            
+            # Screenshot must finish before the form is touched
+            logger.info(f"📸 Login page screenshot saved: {screenshot_future.result(timeout=SCREENSHOT_TIMEOUT)}")
+            
+        except Exception as e:
+            logger.warning(f"Could not save login page for analysis: {e}")
+    
     def _wait_for_login_form(self) -> bool:
         """Wait for login form to appear"""
         try:
-            selectors = self.auth_config.get('selectors', {}).get('login_page_indicators', [])
-            wait = WebDriverWait(self.driver, self.timeouts.get('element_wait', 10))
-            
-            # Try to find the main form first
-            form_selector = self.auth_config.get('selectors', {}).get('login_form', {}).get('form', 'form.space-y-4')
+            wait = self._element_wait
             
+            # One wait for the form or any fallback indicator - a wait per
+            # selector would burn the full timeout on each miss
+            selector = ", ".join([self._sel_form, *self._sel_indicators])
             try:
-                # Wait for the specific form
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, form_selector)))
-                logger.debug(f"Login form found with selector: {form_selector}")
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+                logger.debug(f"Login form found with selector: {selector}")
                 return True
-            except:
-                # Fall back to other indicators
-                for selector in selectors:
-                    try:
-                        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                        logger.debug(f"Login form indicator found: {selector}")
-                        return True
-                    except:
-                        continue
-            
-            return False
+            except TimeoutException:
+                return False
         except Exception as e:
             logger.error(f"Error waiting for login form: {e}")
             return False
@@ -340,20 +488,10 @@ class LoginManager:
     def _fill_credentials(self) -> bool:
         """Fill email and password"""
         try:
-            form_selectors = self.auth_config.get('selectors', {}).get('login_form', {})
-            
-            # Email field - using name attribute which is more stable
-            email_selector = form_selectors.get('email', "input[name='email']")
-            email_field = self._find_element(email_selector)
-            
-            if not email_field:
-                # Try alternative selectors
-                alt_selectors = ["input[type='text'][placeholder*='email']", "#:r0:-form-item"]
-                for selector in alt_selectors:
-                    email_field = self._find_element(selector)
-                    if email_field:
-                        break
+            fields = self._locate_login_fields()
             
+            # Email field - configured selector first, then alternatives
+            email_field = fields.get('email')
             if email_field:
                 email_field.clear()
                 email_field.send_keys(self.email)
@@ -363,17 +501,7 @@ class LoginManager:
                 return False
             
             # Password field
-            password_selector = form_selectors.get('password', "input[name='password']")
-            password_field = self._find_element(password_selector)
-            
-            if not password_field:
-                # Try alternative selectors
-                alt_selectors = ["input[type='password']", "#:r1:-form-item"]
-                for selector in alt_selectors:
-                    password_field = self._find_element(selector)
-                    if password_field:
-                        break
-            
+            password_field = fields.get('password')
             if password_field:
                 password_field.clear()
                 password_field.send_keys(self.password)
@@ -387,23 +515,12 @@ class LoginManager:
         except Exception as e:
             logger.error(f"Failed to fill credentials: {e}")
             return False
-
     
     def _submit_form(self) -> bool:
         """Submit login form"""
         try:
-            form_selectors = self.auth_config.get('selectors', {}).get('login_form', {})
-            submit_selector = form_selectors.get('submit', "button[type='submit']")
-            
-            # Try to find submit button
-            submit_button = self._find_element(submit_selector)
-            
-            if not submit_button:
-                # Try by text content
-                try:
-                    submit_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Sign in')]")
-                except:
-                    pass
+            # Configured selector first, then a button reading "Sign in"
+            submit_button = self._locate_login_fields().get('submit')
             
             if submit_button:
                 # Check if button is enabled
@@ -422,18 +539,17 @@ class LoginManager:
             logger.error(f"Failed to submit form: {e}")
             return False
     
-    def _find_element(self, selector: str):
-        """Find element with multiple selector support"""
-        # Handle multiple selectors (comma-separated)
-        for single_selector in selector.split(','):
-            single_selector = single_selector.strip()
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, single_selector)
-                if element.is_displayed():
-                    return element
-            except:
-                continue
-        return None
+    def _locate_login_fields(self) -> Dict[str, Any]:
+        """
+        Find the email, password and submit elements in one script call
+        
+        Each field's selectors are tried in order and the first visible
+        match wins, so a hit never costs extra WebDriver round-trips.
+        
+        Returns:
+            Dict with 'email', 'password' and 'submit' WebElements (None if not found)
+        """
+        return self.driver.execute_script(LOGIN_FIELDS_SCRIPT, self._field_candidates) or {}
     
     def logout(self) -> bool:
         """Logout and clear session"""
@@ -442,11 +558,9 @@ class LoginManager:
             self.session_manager.clear_session(self.email)
             
             # Try to click logout if possible
-            try:
-                logout_btn = self.driver.find_element(By.CSS_SELECTOR, "a[href*='logout']")
-                logout_btn.click()
-            except:
-                pass
+            logout_btns = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='logout']")
+            if logout_btns:
+                logout_btns[0].click()
             
             logger.info(f"Logged out and cleared session for {self.email}")
             return True
@@ -462,22 +576,39 @@ class LoginManager:
         return self.ensure_logged_in()
 
 
+# Session archives kept per user when archiving is on (auth.json session.archive)
+MAX_SESSION_ARCHIVES = 3
+
 class SessionManager:
     """
     Manages user sessions with proper organization
     """
     
-    def __init__(self, base_dir: Path = Path("data/sessions")):
+    def __init__(self, base_dir: Path = Path("data/sessions"), archive: bool = False,
+                 max_archives: int = MAX_SESSION_ARCHIVES):
         self.base_dir = Path(base_dir)
+        
+        # Keep replaced sessions as timestamped archives, at most max_archives per user
+        self.archive = archive
+        self.max_archives = max_archives
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Parsed metadata keyed by file path -> (mtime_ns, metadata)
+        self._metadata_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        
+        # Created user directories keyed by email - mkdir runs once per email
+        self._user_dir_cache: Dict[str, Path] = {}
         logger.info(f"Session manager initialized at {self.base_dir}")
     
     def _get_user_dir(self, email: str) -> Path:
         """Get user-specific directory (sanitized email)"""
-        # Sanitize email for filesystem
-        sanitized = email.lower().replace('@', '_at_').replace('.', '_dot_')
-        user_dir = self.base_dir / sanitized
-        user_dir.mkdir(parents=True, exist_ok=True)
+        user_dir = self._user_dir_cache.get(email)
+        if user_dir is None:
+            # Sanitize email for filesystem
+            sanitized = email.lower().replace('@', '_at_').replace('.', '_dot_')
+            user_dir = self.base_dir / sanitized
+            user_dir.mkdir(parents=True, exist_ok=True)
+            self._user_dir_cache[email] = user_dir
         return user_dir
     
     def _get_session_file(self, email: str, archive: bool = False) -> Path:
@@ -486,9 +617,9 @@ class SessionManager:
         
         if archive:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            return user_dir / f"session_{timestamp}.pkl"
+            return user_dir / f"session_{timestamp}.json"
         else:
-            return user_dir / "session.pkl"  # Current session
+            return user_dir / "session.json"  # Current session
     
     def _get_metadata_file(self, email: str) -> Path:
         """Get metadata file path for user"""
@@ -509,20 +640,20 @@ class SessionManager:
         session_file = self._get_session_file(email)
         metadata_file = self._get_metadata_file(email)
         
-        # Archive existing session if it exists
-        if session_file.exists():
+        # Archive existing session if enabled, keeping only the newest few
+        if self.archive and session_file.exists():
             archive_file = self._get_session_file(email, archive=True)
-            session_file.rename(archive_file)
+            session_file.replace(archive_file)
             logger.info(f"Archived previous session to {archive_file}")
+            self._rotate_archives(user_dir, self.max_archives)
         
         # Save cookies
         cookies = driver.get_cookies()
-        with open(session_file, 'wb') as f:
-            pickle.dump(cookies, f)
+        session_file.write_bytes(orjson.dumps(cookies))
         
         # Create session info
         session_info = SessionInfo(
-            user_id=hashlib.md5(email.encode()).hexdigest()[:12],
+            user_id=_user_id(email),
             email=email,
             created_at=datetime.now().isoformat(),
             last_used=datetime.now().isoformat(),
@@ -530,8 +661,7 @@ class SessionManager:
         )
         
         # Save metadata
-        with open(metadata_file, 'w') as f:
-            json.dump(asdict(session_info), f, indent=2)
+        metadata_file.write_bytes(orjson.dumps(session_info, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Session saved for {email} at {session_file}")
         return session_info
@@ -557,9 +687,7 @@ class SessionManager:
         
         # Load metadata
         try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-                session_info = SessionInfo(**metadata)
+            session_info = SessionInfo(**orjson.loads(metadata_file.read_bytes()))
         except Exception as e:
             logger.error(f"Failed to load metadata for {email}: {e}")
             return None
@@ -572,35 +700,38 @@ class SessionManager:
         
         # Load cookies
         try:
-            with open(session_file, 'rb') as f:
-                cookies = pickle.load(f)
-            
-            # Navigate to domain first
-            driver.get("https://ehub.alxafrica.com")
-            
-            # Add cookies - silently ignore SameSite errors
-            successful_cookies = 0
-            for cookie in cookies:
-                try:
-                    driver.add_cookie(cookie)
-                    successful_cookies += 1
-                except Exception as e:
-                    # Log only at debug level for SameSite errors
-                    if "SameSite" in str(e):
-                        logger.debug(f"Skipped cookie {cookie.get('name')} - SameSite restriction")
-                    else:
-                        logger.debug(f"Could not add cookie {cookie.get('name')}: {e}")
-                    continue
-            
-            logger.debug(f"Loaded {successful_cookies}/{len(cookies)} cookies")
-            
-            # Refresh to apply cookies
-            driver.refresh()
+            cookies = orjson.loads(session_file.read_bytes())
+            
+            # Chromium: set every cookie in one CDP call - no need to visit the domain first
+            if self._set_cookies_cdp(driver, cookies):
+                logger.debug(f"Loaded {len(cookies)} cookies via CDP")
+            else:
+                # add_cookie needs the domain open - a static asset is enough,
+                # the dashboard itself is loaded once below with the cookies set
+                driver.get("https://ehub.alxafrica.com/favicon.ico")
+                
+                # Add cookies - silently ignore SameSite errors
+                successful_cookies = 0
+                for cookie in cookies:
+                    try:
+                        driver.add_cookie(cookie)
+                        successful_cookies += 1
+                    except Exception as e:
+                        # Log only at debug level for SameSite errors
+                        if "SameSite" in str(e):
+                            logger.debug(f"Skipped cookie {cookie.get('name')} - SameSite restriction")
+                        else:
+                            logger.debug(f"Could not add cookie {cookie.get('name')}: {e}")
+                        continue
+                
+                logger.debug(f"Loaded {successful_cookies}/{len(cookies)} cookies")
+            
+            # Single navigation with the session applied (no refresh)
+            driver.get("https://ehub.alxafrica.com/")
             
             # Update last used
             session_info.last_used = datetime.now().isoformat()
-            with open(metadata_file, 'w') as f:
-                json.dump(asdict(session_info), f, indent=2)
+            metadata_file.write_bytes(orjson.dumps(session_info, option=orjson.OPT_INDENT_2))
             
             logger.info(f"Session loaded for {email}")
             return session_info
@@ -609,6 +740,34 @@ class SessionManager:
             logger.error(f"Failed to load cookies for {email}: {e}")
             return None
         
+    def _rotate_archives(self, user_dir: Path, keep: int = MAX_SESSION_ARCHIVES) -> None:
+        """Delete all but the newest `keep` session archives (timestamps sort by name)"""
+        archives = sorted(user_dir.glob('session_*.json'))
+        for old_archive in archives[:max(len(archives) - keep, 0)]:
+            old_archive.unlink(missing_ok=True)
+            logger.debug(f"Removed old session archive: {old_archive}")
+    
+    def _set_cookies_cdp(self, driver: WebDriver, cookies: List[Dict[str, Any]]) -> bool:
+        """
+        Set all cookies with a single Network.setCookies call
+        
+        Args:
+            driver: Selenium WebDriver
+            cookies: Cookies as returned by driver.get_cookies()
+            
+        Returns:
+            bool: True if set, False if the driver has no CDP or the call failed
+        """
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            return False
+        
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp_cookie(c) for c in cookies]})
+            return True
+        except Exception as e:
+            logger.debug(f"CDP cookie restore failed, adding cookies one by one: {e}")
+            return False
+    
     def clear_session(self, email: str) -> bool:
         """
         Clear all session data for a specific user
@@ -623,7 +782,7 @@ class SessionManager:
             user_dir = self._get_user_dir(email)
             
             # Delete session file
-            session_file = user_dir / "session.pkl"
+            session_file = user_dir / "session.json"
             if session_file.exists():
                 session_file.unlink()
                 logger.debug(f"Deleted session file: {session_file}")
@@ -637,6 +796,7 @@ class SessionManager:
             # Remove user directory if empty
             if user_dir.exists() and not any(user_dir.iterdir()):
                 user_dir.rmdir()
+                self._user_dir_cache.pop(email, None)
                 logger.debug(f"Removed empty directory: {user_dir}")
             
             logger.info(f"Session cleared for {email}")
@@ -647,20 +807,39 @@ class SessionManager:
             return False
     
     def list_sessions(self) -> List[Dict[str, Any]]:
-        """List all available sessions with metadata"""
-        sessions = []
+        """
+        List all available sessions with metadata
+        Only metadata files modified since the last call are re-parsed,
+        and those are read in parallel
+        """
+        sessions: Dict[Path, Dict[str, Any]] = {}
+        stale: List[Tuple[Path, int]] = []
         
         for user_dir in self.base_dir.iterdir():
             if not user_dir.is_dir():
                 continue
             
             metadata_file = user_dir / "metadata.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file, 'r') as f:
-                        metadata = json.load(f)
-                        sessions.append(metadata)
-                except:
-                    continue
-        
-        return sessions
+            try:
+                mtime = metadata_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._metadata_cache.pop(metadata_file, None)
+                continue
+            
+            cached = self._metadata_cache.get(metadata_file)
+            if cached and cached[0] == mtime:
+                sessions[metadata_file] = cached[1]
+            else:
+                stale.append((metadata_file, mtime))
+        
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(16, len(stale))) as executor:
+                results = executor.map(_read_metadata, [path for path, _ in stale])
+                for (metadata_file, mtime), metadata in zip(stale, results):
+                    if metadata is None:
+                        continue
+                    self._metadata_cache[metadata_file] = (mtime, metadata)
+                    sessions[metadata_file] = metadata
+        
+        # Stable order (by user directory), independent of cache hits
+        return [sessions[path] for path in sorted(sessions)]
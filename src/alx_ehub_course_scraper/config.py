@@ -1,50 +1,82 @@
 import json
 import os
+import time
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+from typing import Dict, Any, Optional, Tuple
+from ._env import load_env, reload_env
+import orjson
+
+# Per-user cache for resolved driver paths
+CACHE_DIR = Path.home() / ".cache" / "alx_ehub_scraper"
+
+# Sub-config properties backed by cached_property, cleared on reload()
+SUB_CONFIGS = ('auth_config', 'courses_config', 'savannah_config', 'athena_config')
 
 class Config:
     def __init__(self) -> None:
-        # Load environment variables
-        load_dotenv()
-        
         self.base_dir: Path = Path(__file__).parent.parent.parent
         self.config_dir: Path = self.base_dir / "config"
         self.data: Dict[str, Any] = {}
+        # Parsed config files keyed by file name -> (mtime_ns, size, data)
+        self._json_cache: Dict[str, Tuple[int, int, Any]] = {}
+        
+        # Load environment variables
+        load_env()
+        self._load()
+        
+        # Resolved driver binaries, so webdriver_manager isn't consulted every run
+        self.driver_cache_file: Path = CACHE_DIR / "driver_path.json"
+        self._driver_cache: Dict[str, str] = self._load_driver_cache()
+        
+    def reload(self) -> None:
+        """Re-read .env and config files in place (shared instances see the change)"""
+        reload_env()
+        self._load()
+        
+    def _load(self) -> None:
+        """Read settings.json and resolve the frequently read settings"""
+        # Drop lazily loaded sub-configs so they are re-read on next access
+        for name in SUB_CONFIGS:
+            self.__dict__.pop(name, None)
+        
         self._load_all_configs()
         
+        # Frequently read settings, resolved once (env overrides applied)
+        browser_defaults = self.data['browser_defaults']
+        self.default_browser: str = os.getenv('DEFAULT_BROWSER', browser_defaults['default_browser'])
+        self.headless_mode: bool = os.getenv('HEADLESS_MODE', str(browser_defaults['headless'])).lower() == 'true'
+        self.stealth_mode: bool = browser_defaults['stealth_mode']
+        
     def _load_all_configs(self) -> None:
-        """Load all configuration files"""
-        # Load main settings
-        settings_file = self.config_dir / "settings.json"
-        with open(settings_file, 'r') as f:
-            self.data = json.load(f)
-        
-        # Load auth config if it exists
-        auth_file = self.config_dir / "auth.json"
-        if auth_file.exists():
-            with open(auth_file, 'r') as f:
-                self.data['auth'] = json.load(f)
-        
-        # Load courses config if it exists
-        courses_file = self.config_dir / "courses.json"
-        if courses_file.exists():
-            with open(courses_file, 'r') as f:
-                self.data['courses'] = json.load(f)
-        
-        # ===== ADD THIS =====
-        # Load savannah config if it exists
-        savannah_file = self.config_dir / "savannah.json"
-        if savannah_file.exists():
-            with open(savannah_file, 'r') as f:
-                self.data['savannah'] = json.load(f)
-        
-        # Load athena config if it exists
-        athena_file = self.config_dir / "athena.json"
-        if athena_file.exists():
-            with open(athena_file, 'r') as f:
-                self.data['athena'] = json.load(f)
+        """Load main settings - sub-configs are loaded on first access"""
+        self.data = self._load_json("settings.json")
+    
+    def _load_json(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a config file, reusing the cached parse while its mtime and size are unchanged
+        
+        Args:
+            filename: File name inside config_dir
+        
+        Returns:
+            Parsed config, or None if the file doesn't exist
+        """
+        path = self.config_dir / filename
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        cached = self._json_cache.get(filename)
+        if cached and cached[:2] == fingerprint:
+            return cached[2]
+        
+        data = orjson.loads(path.read_bytes())
+        self._json_cache[filename] = (*fingerprint, data)
+        
+        return data
     
     def get_driver_cache_path(self, browser: str) -> str:
         """Get driver cache path with environment override"""
@@ -64,16 +96,51 @@ class Config:
         default_path.mkdir(parents=True, exist_ok=True)
         return str(default_path)
     
-    @property
-    def default_browser(self) -> str:
-        return os.getenv('DEFAULT_BROWSER', self.data['browser_defaults']['default_browser'])
+    def _load_driver_cache(self) -> Dict[str, str]:
+        """Load cached driver paths unless the cache is older than cache_valid_days"""
+        if not self.driver_cache_file.exists():
+            return {}
+        
+        max_age = self.data['drivers'].get('cache_valid_days', 7) * 86400
+        if time.time() - self.driver_cache_file.stat().st_mtime > max_age:
+            return {}
+        
+        try:
+            with open(self.driver_cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def get_cached_driver_path(self, browser: str) -> Optional[str]:
+        """Get cached driver binary path if it still exists"""
+        path = self._driver_cache.get(browser.lower())
+        if path and Path(path).exists():
+            return path
+        return None
     
-    @property
-    def headless_mode(self) -> bool:
-        env_value = os.getenv('HEADLESS_MODE', str(self.data['browser_defaults']['headless'])).lower()
-        return env_value == 'true'
+    def cache_driver_path(self, browser: str, path: str) -> None:
+        """Remember a resolved driver binary path"""
+        self._driver_cache[browser.lower()] = path
+        self.driver_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.driver_cache_file, 'w') as f:
+            json.dump(self._driver_cache, f, indent=2)
     
-    @property
+    @cached_property
     def auth_config(self) -> Dict[str, Any]:
-        """Get auth configuration"""
-        return self.data.get('auth', {})
\ No newline at end of file
+        """Get auth configuration (auth.json, read on first access)"""
+        return self._load_json("auth.json") or {}
+    
+    @cached_property
+    def courses_config(self) -> Dict[str, Any]:
+        """Get courses configuration (courses.json, read on first access)"""
+        return self._load_json("courses.json") or {}
+    
+    @cached_property
+    def savannah_config(self) -> Dict[str, Any]:
+        """Get Savannah configuration (savannah.json, read on first access)"""
+        return self._load_json("savannah.json") or {}
+    
+    @cached_property
+    def athena_config(self) -> Dict[str, Any]:
+        """Get Athena configuration (athena.json, read on first access)"""
+        return self._load_json("athena.json") or {}
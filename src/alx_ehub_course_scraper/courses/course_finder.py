@@ -1,32 +1,200 @@
 # src/alx_ehub_course_scraper/courses/course_finder.py
+import itertools
 import logging
 import re
-import time
-import json
-from typing import List, Optional, Dict, Any, Tuple
+import multiprocessing
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from pathlib import Path
 from urllib.parse import urljoin
 from datetime import datetime
-from enum import Enum
 
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 
-from .models import Course, CourseList
-from .exceptions import CourseNotFoundError, CourseParsingError
+from .models import Course, CourseList, Platform, STATUS_ICONS
+from .exceptions import CourseNotFoundError
+from .page_parser import parse_course_containers
+from .. import get_config
+from ..config import Config
+from ..driver_manager import DriverManager
+from ..logging_setup import setup_logging, shutdown_logging
+from ..page_capture import save_page_snapshot, save_screenshot_async, SCREENSHOT_TIMEOUT
 
 # Create logger
 logger = logging.getLogger(__name__)
 
-class Platform(Enum):
-    """Supported platforms"""
-    ATHENA = "athena"
-    SAVANNAH = "savannah"
-    UNKNOWN = "unknown"
+# extractCourse(container, sel, baseUrl) reads every course field of one
+# container. Visibility approximates WebElement.is_displayed(); innerText
+# matches .text. The button's URL-like attribute is resolved here (against
+# baseUrl), mirroring page_parser.attribute_url and its PREFERRED_URL_ATTRIBUTES,
+# so only the URL crosses the wire
+EXTRACT_COURSE_JS = """
+const PREFERRED_URL_ATTRS = [
+    'data-url', 'data-href', 'data-link', 'data-path',
+    'data-course-url', 'data-redirect', 'data-target',
+    'href', 'data-src', 'data-action'
+];
+function extractCourse(container, sel, baseUrl) {
+    const visible = (el) => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    const text = (el) => (el.innerText || '').trim();
+    const all = (selector) => {
+        if (!selector) return [];
+        try { return Array.from(container.querySelectorAll(selector)); } catch (e) { return []; }
+    };
+    const firstVisibleText = (selector) => {
+        const el = all(selector).find(e => text(e) && visible(e));
+        return el ? text(el) : null;
+    };
+
+    const buttons = all('button');
+    const button = buttons.find(visible);
+    let buttonData = null;
+    if (button) {
+        const urlOf = (name, value) => {
+            if (!value) return null;
+            if (value.length > 5 && /url|href|link|path|redirect/i.test(name)) return value.trim();
+            if (['http', '/', './', '../'].some(p => value.startsWith(p))) return value;
+            return null;
+        };
+        // Well-known attributes first; only scan the rest if none matched
+        let url = null;
+        for (const name of PREFERRED_URL_ATTRS) {
+            url = urlOf(name, button.getAttribute(name));
+            if (url) break;
+        }
+        if (!url) {
+            for (const attr of button.attributes) {
+                if (PREFERRED_URL_ATTRS.includes(attr.name)) continue;
+                url = urlOf(attr.name, attr.value);
+                if (url) break;
+            }
+        }
+        if (url && url.startsWith('/')) url = baseUrl + url;
+        const parent = button.closest('a');
+        buttonData = {
+            text: text(button),
+            url: url,
+            onclick: button.getAttribute('onclick'),
+            parentHref: parent ? parent.href : null
+        };
+    }
+    // First match without a hidden attribute - no layout query, same pick as page_parser
+    const icon = all(sel.icon).find(el => !el.hasAttribute('hidden'));
+
+    return {
+        primary: firstVisibleText(sel.primary),
+        secondary: firstVisibleText(sel.secondary),
+        spans: all('span').filter(visible).map(text).filter(t => t),
+        description: firstVisibleText(sel.description),
+        metadata: all(sel.metadata).map(text),
+        badges: all(sel.badge).filter(visible).map(text),
+        firstButtonText: buttons.length && visible(buttons[0]) ? text(buttons[0]) : null,
+        button: buttonData,
+        icon: icon ? icon.outerHTML : null
+    };
+}
+"""
+
+# Every container matching arguments[0], in page order, in one round-trip
+COURSES_BULK_SCRIPT = EXTRACT_COURSE_JS + """
+const sel = arguments[1], baseUrl = arguments[2];
+return Array.from(document.querySelectorAll(arguments[0]), container => extractCourse(container, sel, baseUrl));
+"""
+
+# Container number arguments[3] and its course fields, or null if there are fewer
+COURSE_AT_SCRIPT = EXTRACT_COURSE_JS + """
+const container = document.querySelectorAll(arguments[0])[arguments[3]];
+return container ? {element: container, fields: extractCourse(container, arguments[1], arguments[2])} : null;
+"""
+
+# Name, link, average and active flag of every Savannah dropdown item
+# (arguments[0] = item selector), plus the selected course's name
+# (arguments[1] = its selector) - all in one round-trip
+SAVANNAH_ITEMS_SCRIPT = """
+const currentEl = document.querySelector(arguments[1]);
+const items = [];
+for (const item of document.querySelectorAll(arguments[0])) {
+    const link = item.querySelector('a.dropdown-item');
+    if (!link) continue;
+    const nameEl = link.querySelector('.fs-4.fw-medium, span:first-child');
+    const name = nameEl ? (nameEl.innerText || '').trim() : (link.innerText || '').split('\\n')[0].trim();
+    const avgEl = link.querySelector('.text-muted .fw-medium');
+    items.push({
+        name: name,
+        href: link.href || link.getAttribute('href'),
+        average: avgEl ? (avgEl.innerText || '').trim() || null : null,
+        isActive: item.querySelector('.fa-check') !== null
+    });
+}
+return {current: currentEl ? (currentEl.innerText || '').trim() || null : null, items: items};
+"""
+
+# Resolves once every finite CSS animation/transition on the page has
+# finished, or after arguments[0] ms (looping spinners never finish)
+ANIMATIONS_END_SCRIPT = """
+const finite = document.getAnimations().filter(a => a.effect && a.effect.getComputedTiming().endTime !== Infinity);
+const timeout = new Promise(resolve => setTimeout(() => resolve(false), arguments[0]));
+return Promise.race([Promise.allSettled(finite.map(a => a.finished)).then(() => true), timeout]);
+"""
+
+# Opens arguments[0]'s link (enclosing <a>, data-href or href) in a new tab.
+# Returns false when the button has no link and has to be clicked instead
+OPEN_IN_TAB_SCRIPT = """
+const button = arguments[0];
+const link = button.closest('a');
+const url = (link && link.href) || button.getAttribute('data-href') || button.getAttribute('href');
+if (!url) return false;
+window.open(url, '_blank');
+return true;
+"""
+
+# Course metadata and link patterns, compiled once
+_DATE_RE = re.compile(r'(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})')
+_DURATION_RE = re.compile(r'(\d+\s+(?:week|month|year)s?)', re.IGNORECASE)
+_CURRICULUM_RE = re.compile(r'/curriculums/(\d+)/')
+# Span texts that are status/button/duration labels rather than course names
+_NAME_REJECT_RE = re.compile(r'completed|continue|start|weeks|months', re.IGNORECASE)
+# Relative path, absolute URL, window.location = ..., location.href = ...
+# in one alternation, so an onclick string is scanned once
+_ONCLICK_URL_RE = re.compile(
+    r"['\"](?P<rel>/[^'\"]*)['\"]"
+    r"|['\"](?P<abs>https?://[^'\"]*)['\"]"
+    r"|window\.location[= ]+['\"](?P<wl>[^'\"]*)['\"]"
+    r"|location\.href[= ]+['\"](?P<lh>[^'\"]*)['\"]"
+)
+
+def _worker_discover_savannah(session: Dict[str, Any], save_debug: bool) -> List[Course]:
+    """
+    Discover Savannah courses in a worker process
+    
+    Starts a headless browser, restores the exported session into it and
+    runs CourseFinder.discover_savannah there. Runs in a spawned process:
+    nothing of the parent's (driver, capture threads) is inherited.
+    
+    Args:
+        session: Output of CourseFinder.export_session()
+        save_debug: Save debug HTML for analysis
+    
+    Returns:
+        Savannah courses
+    """
+    # The worker has its own root logger - without this its records are dropped
+    setup_logging()
+    # A DriverManager of our own - close_driver() must never reach the parent's browser
+    manager = DriverManager(get_config())
+    
+    try:
+        finder = CourseFinder(manager.get_driver(headless=True), get_config(), cookies=session['cookies'])
+        finder.import_session(session)
+        return finder.discover_savannah(save_debug)
+    finally:
+        manager.close_driver()
+        # Flush queued records - pool workers may exit without running atexit
+        shutdown_logging()
 
 class CourseFinder:
     """
@@ -34,22 +202,56 @@ class CourseFinder:
     Uses the EXISTING authenticated driver from main.py
     """
     
-    def __init__(self, driver: WebDriver, config: Dict[str, Any]):
+    def __init__(self, driver: WebDriver, config: Config):
         """
         Initialize CourseFinder with EXISTING driver
         
         Args:
             driver: Selenium WebDriver (ALREADY AUTHENTICATED from main.py)
-            config: Configuration dictionary (from Config class)
+            config: Config instance
         """
         self.driver = driver
         self.config = config
         
+        # Session cookies handed to worker processes, read from the driver on first use
+        self.cookies: Optional[List[Dict[str, Any]]] = None
+        
         # Load course config
-        self.course_config = config.get('courses', {})
+        self.course_config = config.courses_config
         self.selectors = self.course_config.get('course_selectors', {})
         self.page_config = self.course_config.get('course_page', {})
         
+        # Resolved once - read on every wait and container lookup
+        self.container_sel = self.selectors.get('container', '.flex.gap-6.my-4')
+        self.wait_timeout = self.page_config.get('timeout', 10)
+        self.wait_for_sel = self.page_config.get('wait_for', '.flex.gap-6.my-4')
+        self.completed_text = self.selectors.get('status_badge', {}).get('completed_text', 'Completed')
+        
+        # One WebDriverWait per timeout, created on first use and reused by every wait
+        self._waits: Dict[float, WebDriverWait] = {}
+        
+        # Processes for platform discovery: 2+ runs Savannah in a worker process while
+        # this driver explores Athena (1 = this driver does both, one after the other)
+        self.parallel_workers = self.course_config.get('discovery', {}).get('parallel_workers', 1)
+        
+        # Seconds to wait for the Savannah worker before giving up on it
+        self.worker_timeout = self.course_config.get('discovery', {}).get('worker_timeout', 600)
+        
+        # Keep each course's icon SVG (off by default - it's the bulk of the payload)
+        self.capture_icons = self.course_config.get('discovery', {}).get('capture_icons', False)
+        
+        # Field selectors for COURSES_BULK_SCRIPT and the page_source parser
+        name_selectors = self.selectors.get('name', {})
+        self._script_selectors = {
+            'primary': name_selectors.get('primary'),
+            'secondary': name_selectors.get('secondary'),
+            'description': self.selectors.get('description', 'p.text-sm.text-popover-foreground'),
+            'metadata': self.selectors.get('metadata', {}).get('container', '.flex.flex-wrap.gap-1.items-center'),
+            'badge': self.selectors.get('status_badge', {}).get('selector', '.text-success'),
+            # Icon SVG markup is large and rarely needed - only read it when asked to
+            'icon': 'svg' if self.capture_icons else None,
+        }
+        
         # Base URLs
         self.athena_base_url = "https://ehub.alxafrica.com"
         self.savannah_base_url = "https://savannah.alxafrica.com"
@@ -57,8 +259,17 @@ class CourseFinder:
         # Create directories for captures
         self.athena_debug_dir = Path("data/athena_pages")
         self.savannah_debug_dir = Path("data/savannah_pages")
-        self.athena_debug_dir.mkdir(parents=True, exist_ok=True)
-        self.savannah_debug_dir.mkdir(parents=True, exist_ok=True)
+        self.dashboard_debug_dir = Path("data/dashboard_pages")
+        self.discovery_report_dir = Path("data/discovery_reports")
+        for capture_dir in (self.athena_debug_dir, self.savannah_debug_dir,
+                            self.dashboard_debug_dir, self.discovery_report_dir):
+            capture_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Course name -> container position on the dashboard, built once per visit
+        self._dashboard_index: Optional[Dict[str, int]] = None
+        
+        # Suffix for capture filenames - keeps captures taken within one second apart
+        self._capture_counter = itertools.count()
         
         logger.info("✅ CourseFinder initialized with multi-platform support")
     
@@ -74,27 +285,32 @@ class CourseFinder:
             CourseList object containing all courses from all platforms
         """
         logger.info("Starting multi-platform course discovery")
-        all_courses = []
+        
+        # Discovery steps stream their courses straight into this one list
+        all_courses: List[Course] = []
         
         try:
             # STEP 1: Discover dashboard courses (main page)
             logger.info("🔍 Discovering dashboard courses...")
-            dashboard_courses = self._discover_dashboard_courses(save_debug)
-            all_courses.extend(dashboard_courses)
-            logger.info(f"✅ Found {len(dashboard_courses)} dashboard courses")
+            all_courses.extend(self._discover_dashboard_courses(save_debug))
+            dashboard_count = len(all_courses)
+            logger.info(f"✅ Found {dashboard_count} dashboard courses")
+            
+            # STEP 2+3: Savannah in a worker process while this driver explores Athena
+            if explore_platforms and self.parallel_workers > 1:
+                all_courses.extend(self._discover_platforms_in_parallel(save_debug, all_courses[:dashboard_count]))
             
             # STEP 2: Discover Savannah courses if requested
-            if explore_platforms:
+            elif explore_platforms:
                 logger.info("🔍 Discovering Savannah courses...")
-                savannah_courses = self._discover_savannah_courses(save_debug)
-                all_courses.extend(savannah_courses)
-                logger.info(f"✅ Found {len(savannah_courses)} Savannah courses")
+                all_courses.extend(self._discover_savannah_courses(save_debug))
+                logger.info(f"✅ Found {len(all_courses) - dashboard_count} Savannah courses")
                 
                 # STEP 3: Discover Athena courses - USING CORRECT METHOD NAME
                 logger.info("🔍 Discovering Athena courses...")
-                athena_courses = self._explore_athena_platforms(save_debug)  # <-- FIXED: _explore_athena_platforms
-                all_courses.extend(athena_courses)
-                logger.info(f"✅ Found {len(athena_courses)} Athena courses")
+                count_before = len(all_courses)
+                all_courses.extend(self._explore_athena_platforms(save_debug, all_courses[:dashboard_count]))
+                logger.info(f"✅ Found {len(all_courses) - count_before} Athena courses")
             
             # STEP 4: Save comprehensive report
             if save_debug:
@@ -106,7 +322,117 @@ class CourseFinder:
         except Exception as e:
             logger.error(f"Course discovery failed: {e}", exc_info=True)
             raise CourseNotFoundError(f"Failed to discover courses: {e}")
+
+    def _find_optional(self, selector: str, parent: Optional[WebElement] = None) -> Optional[WebElement]:
+        """
+        Find an element that may legitimately be missing
         
+        Args:
+            selector: CSS selector
+            parent: Element to search within (defaults to the whole page)
+            
+        Returns:
+            First matching element, or None instead of raising
+        """
+        elements = (parent or self.driver).find_elements(By.CSS_SELECTOR, selector)
+        return elements[0] if elements else None
+    
+    def _discover_platforms_in_parallel(self, save_debug: bool,
+                                        dashboard_courses: List[Course]) -> List[Course]:
+        """
+        Discover Savannah courses in a worker process while exploring Athena here
+        
+        The worker starts its own headless browser with this session's
+        cookies, so Savannah no longer waits on the Athena platforms or on
+        this driver. It is spawned rather than forked, and killed if it
+        outlives worker_timeout.
+        
+        Args:
+            save_debug: Save debug HTML for analysis
+            dashboard_courses: Courses already parsed from the dashboard
+            
+        Returns:
+            Savannah courses followed by Athena courses
+        """
+        session = self.export_session()
+        courses = []
+        
+        logger.info("🔍 Discovering Savannah courses in a worker process, Athena in this browser...")
+        
+        # Spawn, not fork: a forked child inherits this process's capture
+        # threads and driver state in a state it can't use
+        pool = multiprocessing.get_context("spawn").Pool(processes=1)
+        try:
+            savannah_result = pool.apply_async(_worker_discover_savannah, (session, save_debug))
+            athena_courses = self._explore_athena_platforms(save_debug, dashboard_courses)
+            
+            try:
+                courses.extend(savannah_result.get(timeout=self.worker_timeout))
+                logger.info(f"✅ Found {len(courses)} Savannah courses")
+            except multiprocessing.TimeoutError:
+                logger.error(f"Savannah worker timed out after {self.worker_timeout}s")
+            except Exception as e:
+                logger.error(f"Savannah worker failed: {e}")
+        finally:
+            # The worker has returned (or timed out) - don't wait on it any longer
+            pool.terminate()
+            pool.join()
+        
+        courses.extend(athena_courses)
+        logger.info(f"✅ Found {len(athena_courses)} Athena courses")
+        return courses
+    
+    def export_session(self) -> Dict[str, Any]:
+        """
+        Export the authenticated browser session for other browsers/processes
+        
+        Returns:
+            Dict with the session 'cookies' and the browser's 'user_agent'
+        """
+        return {
+            'cookies': self._get_session_cookies(),
+            'user_agent': self.driver.execute_script("return navigator.userAgent")
+        }
+    
+    def import_session(self, session: Dict[str, Any]):
+        """
+        Restore a session from export_session() into this finder's browser
+        
+        Args:
+            session: Dict with the session 'cookies' and the browser's 'user_agent'
+        """
+        # Headless Chrome announces itself in the User-Agent - reuse the exporter's
+        if session.get('user_agent') and hasattr(self.driver, 'execute_cdp_cmd'):
+            self.driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": session['user_agent']})
+        
+        # add_cookie needs the domain open - a static asset is enough
+        self.driver.get(f"{self.athena_base_url}/favicon.ico")
+        for cookie in session['cookies']:
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException as e:
+                logger.debug(f"Could not add cookie {cookie.get('name')}: {e}")
+        self.cookies = session['cookies']
+    
+    def discover_savannah(self, save_debug: bool = False) -> List[Course]:
+        """
+        Open the dashboard and discover Savannah courses
+        
+        Args:
+            save_debug: Save debug HTML for analysis
+            
+        Returns:
+            Savannah courses
+        """
+        self.driver.get(self.athena_base_url)
+        self._wait_for_courses()
+        return self._discover_savannah_courses(save_debug)
+    
+    def _get_session_cookies(self) -> List[Dict[str, Any]]:
+        """Get the session cookies, exporting them from the driver on first use"""
+        if self.cookies is None:
+            self.cookies = self.driver.get_cookies()
+        return self.cookies
 
     def _ensure_on_dashboard(self):
         """Ensure we're on the main dashboard page"""
@@ -116,13 +442,17 @@ class CourseFinder:
         # If not on dashboard, navigate to it
         if "ehub.alxafrica.com" not in current_url or "/login" in current_url:
             logger.info("Navigating to dashboard")
+            self._dashboard_index = None
             self.driver.get("https://ehub.alxafrica.com")
-            time.sleep(3)
+            self._wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, self.wait_for_sel)))
         
-    def _discover_dashboard_courses(self, save_debug: bool = False) -> List[Course]:
-        """Discover courses on the main dashboard page"""
-        courses = []
+    def _discover_dashboard_courses(self, save_debug: bool = False) -> Iterator[Course]:
+        """
+        Discover courses on the main dashboard page, yielding each as it is parsed
         
+        Args:
+            save_debug: Save debug HTML for analysis
+        """
         try:
             # Ensure on dashboard
             self._ensure_on_dashboard()
@@ -134,41 +464,40 @@ class CourseFinder:
             if save_debug:
                 self._save_dashboard_debug()
             
-            # Get containers
-            containers = self._get_course_containers()
+            # Parse all containers from one page snapshot
+            containers = self._get_course_data_from_page()
             logger.info(f"Found {len(containers)} dashboard course containers")
+            self._dashboard_index = self._build_dashboard_index(containers)
             
-            for container in containers:
+            for idx, data in enumerate(containers):
                 try:
-                    course = self._parse_course(container)
+                    course = self._parse_course(data)
                     if course:
+                        # Lets navigate_to_course fetch this container directly
+                        course.metadata['container_index'] = idx
                         # Check if this is the Savannah entry point
                         if course.name == "Professional Foundations":
                             course.platform = Platform.SAVANNAH  # Mark as Savannah
                         else:
                             course.platform = Platform.ATHENA    # Mark as Athena
-                        courses.append(course)
                         logger.debug(f"✅ Parsed dashboard course: {course.name} [{course.platform.value}]")
+                        yield course
                 except Exception as e:
                     logger.error(f"Failed to parse dashboard course: {e}")
                     continue
                     
         except Exception as e:
             logger.error(f"Dashboard discovery failed: {e}")
-        
-        return courses
-
+    
+    def _capture_stamp(self) -> str:
+        """Timestamp for a capture filename, unique within this finder"""
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{next(self._capture_counter)}"
+    
     def _save_dashboard_debug(self):
         """Save dashboard page HTML for analysis"""
         try:
-            debug_dir = Path("data/dashboard_pages")
-            debug_dir.mkdir(parents=True, exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            html_file = debug_dir / f"dashboard_{timestamp}.html"
-            
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
+            timestamp = self._capture_stamp()
+            html_file = save_page_snapshot(self.driver, self.dashboard_debug_dir / f"dashboard_{timestamp}")
             
             logger.info(f"📄 Dashboard debug HTML saved: {html_file}")
             
@@ -176,62 +505,111 @@ class CourseFinder:
             logger.warning(f"Failed to save dashboard debug: {e}")
 
 
-    def _explore_athena_platforms(self, save_debug: bool) -> List[Course]:
+    def _explore_athena_platforms(self, save_debug: bool,
+                                  known_courses: Optional[List[Course]] = None) -> List[Course]:
         """
-        Click into each Athena course and explore its platform
+        Open each Athena course and explore its platform
+        
+        Courses whose link is already known are opened in parallel tabs,
+        so the browser loads them concurrently; the rest are entered one at
+        a time from the dashboard, in a new tab whenever possible, so that
+        getting back is a tab close rather than a dashboard reload.
+        
+        Parsing isn't implemented yet, so the visits only produce debug
+        captures - without save_debug the platforms aren't opened at all.
+        
+        Args:
+            save_debug: Save debug HTML for analysis
+            known_courses: Courses already parsed from the dashboard (for their links)
         """
         athena_courses = []
+        if not save_debug:
+            logger.debug("Athena platforms only yield debug captures - skipped without save_debug")
+            return athena_courses
+        
         athena_names = ["Data Analytics", "Python", "Machine Learning"]
         
+        known_urls = {c.name: c.full_url for c in known_courses or [] if c.full_url}
+        tab_urls = {name: known_urls[name] for name in athena_names if name in known_urls}
+        
+        if tab_urls:
+            self._explore_athena_tabs(tab_urls, save_debug)
+        
+        original_window = self.driver.current_window_handle
+        
         for course_name in athena_names:
+            if course_name in tab_urls:
+                continue
             try:
-                if self._enter_athena(course_name):
+                if self._enter_athena(course_name, save_debug):
                     # Parse Athena platform content
                     # TODO: After analyzing saved HTML, implement proper parsing
                     logger.info(f"🔍 Need to parse Athena: {course_name}")
                     
-                    # Return to dashboard
-                    self.driver.back()
-                    time.sleep(3)
+                    # Return to dashboard - closes the platform tab, or goes back
+                    # only when the platform replaced the dashboard
+                    in_new_tab = self.driver.current_window_handle != original_window
+                    self._return_to_dashboard(original_window)
+                    if not in_new_tab:
+                        self._wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, self.wait_for_sel)))
             except Exception as e:
                 logger.error(f"Failed to explore {course_name}: {e}")
                 self.driver.get(self.athena_base_url)
-                time.sleep(3)
+                self._wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, self.wait_for_sel)))
         
         return athena_courses
     
-    def _discover_athena_courses(self, save_debug: bool = False) -> List[Course]:
-        """Discover courses on Athena platform (main dashboard)"""
-        courses = []
+    def _explore_athena_tabs(self, course_urls: Dict[str, str], save_debug: bool = False):
+        """
+        Open every Athena course in its own tab at once, then capture each
         
-        try:
-            # Ensure on Athena dashboard
-            self._ensure_on_athena_dashboard()
-            
-            # Wait for courses
-            self._wait_for_courses()
-            
-            # Save debug HTML
-            if save_debug:
-                self._save_athena_debug()
-            
-            # Get containers
-            containers = self._get_course_containers()
-            
-            for container in containers:
-                try:
-                    course = self._parse_course(container)
-                    if course:
-                        course.platform = Platform.ATHENA
-                        courses.append(course)
-                except Exception as e:
-                    logger.error(f"Failed to parse Athena course: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Athena discovery failed: {e}")
+        All tabs start loading from a single script call; WebDriver then
+        only visits tabs that are already loading (or loaded) in parallel.
         
-        return courses
+        Args:
+            course_urls: Course name -> platform URL
+            save_debug: Capture each platform page for analysis
+        """
+        original_window = self.driver.current_window_handle
+        handles_before = set(self.driver.window_handles)
+        tab_names = {f"athena-{i}": name for i, name in enumerate(course_urls)}
+        
+        logger.info(f"🚀 Opening {len(tab_names)} Athena platforms in parallel tabs")
+        self.driver.execute_script(
+            "for (const [tab, url] of arguments[0]) window.open(url, tab);",
+            [[tab, course_urls[name]] for tab, name in tab_names.items()]
+        )
+        
+        for tab, course_name in tab_names.items():
+            try:
+                # Selenium falls back to matching window.name when tab isn't a handle
+                self.driver.switch_to.window(tab)
+                self._wait_until(lambda d: d.execute_script("return document.readyState") != "loading")
+                
+                # Save Athena page for analysis
+                if save_debug:
+                    self._save_athena_platform_debug(course_name)
+                
+                logger.info(f"🔍 Visited Athena platform: {course_name}")
+            except Exception as e:
+                logger.error(f"Failed to explore {course_name}: {e}")
+            finally:
+                self._close_tab(original_window)
+        
+        # Tabs that couldn't even be switched to are still open
+        for handle in set(self.driver.window_handles) - handles_before:
+            self.driver.switch_to.window(handle)
+            self._close_tab(original_window)
+    
+    def _close_tab(self, original_window: str):
+        """Close the current tab unless it is original_window, then switch back to it"""
+        try:
+            if self.driver.current_window_handle != original_window:
+                self.driver.close()
+        except WebDriverException as e:
+            logger.debug(f"Could not close tab: {e}")
+        finally:
+            self.driver.switch_to.window(original_window)
     
     def _discover_savannah_courses(self, save_debug: bool = False) -> List[Course]:
         """
@@ -246,8 +624,8 @@ class CourseFinder:
                 logger.warning("Could not enter Savannah")
                 return courses
             
-            # Step 2: Wait for page to load
-            time.sleep(3)
+            # Step 2: Wait for the curriculum switcher to render
+            self._wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, "#student-switch-curriculum")))
             
             # Step 3: Save debug HTML
             if save_debug:
@@ -265,27 +643,50 @@ class CourseFinder:
         
         return courses
     
-    def _enter_athena(self, course_name: str) -> bool:
+    def _enter_athena(self, course_name: str, save_debug: bool = False) -> bool:
         """
-        Click on a specific Athena course to enter its platform
+        Enter a specific Athena course's platform
+        
+        Opens the course button's link in a new tab when it has one;
+        otherwise clicks the button. Either way the driver ends up on
+        the platform page (switched to the new tab if one opened).
+        
+        Args:
+            course_name: Dashboard name of the course
+            save_debug: Capture the platform page for analysis
+        
+        Returns:
+            True if the platform was entered
         """
         try:
-            containers = self._get_course_containers()
+            container = self._find_dashboard_container(course_name)
+            if container is None:
+                return False
             
-            for container in containers:
-                name = self._extract_name(container)
-                if name and name == course_name:
-                    logger.info(f"🚀 Entering Athena: {course_name}")
-                    
-                    button = container.find_element(By.CSS_SELECTOR, "button")
-                    button.click()
-                    time.sleep(5)
-                    
-                    # Save Athena page for analysis
-                    self._save_athena_platform_debug(course_name)
-                    return True
-                    
-            return False
+            button = self._find_optional("button", container)
+            if button is None:
+                logger.warning(f"No button to enter Athena: {course_name}")
+                return False
+            
+            logger.info(f"🚀 Entering Athena: {course_name}")
+            
+            url_before = self.driver.current_url
+            handles_before = set(self.driver.window_handles)
+            if not self.driver.execute_script(OPEN_IN_TAB_SCRIPT, button):
+                button.click()
+            
+            # Continue as soon as the platform opens (navigation or new tab)
+            self._wait_until(lambda d: d.current_url != url_before or len(d.window_handles) > len(handles_before))
+            
+            new_handles = [h for h in self.driver.window_handles if h not in handles_before]
+            if new_handles:
+                self.driver.switch_to.window(new_handles[0])
+                self._wait_until(lambda d: d.execute_script("return document.readyState") != "loading")
+            
+            # Save Athena page for analysis
+            if save_debug:
+                self._save_athena_platform_debug(course_name)
+            return True
         except Exception as e:
             logger.error(f"Failed to enter Athena {course_name}: {e}")
             return False
@@ -293,17 +694,16 @@ class CourseFinder:
     def _save_athena_platform_debug(self, course_name: str):
         """Save Athena platform page for analysis"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._capture_stamp()
             safe_name = course_name.lower().replace(' ', '_')
+            base_path = self.athena_debug_dir / f"athena_{safe_name}_{timestamp}"
+            
+            screenshot_future = save_screenshot_async(self.driver, base_path)
             
-            html_file = self.athena_debug_dir / f"athena_{safe_name}_{timestamp}.html"
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
+            html_file = save_page_snapshot(self.driver, base_path)
             logger.info(f"📄 Athena platform HTML saved: {html_file}")
             
-            screenshot = self.athena_debug_dir / f"athena_{safe_name}_{timestamp}.png"
-            self.driver.save_screenshot(str(screenshot))
-            logger.info(f"📸 Athena screenshot saved: {screenshot}")
+            logger.info(f"📸 Athena screenshot saved: {screenshot_future.result(timeout=SCREENSHOT_TIMEOUT)}")
             
         except Exception as e:
             logger.error(f"Failed to save Athena debug: {e}")
@@ -320,12 +720,12 @@ class CourseFinder:
             else:
                 # Same tab - go back
                 self.driver.back()
-                time.sleep(3)
+                self._wait_until(EC.url_contains("ehub.alxafrica.com"))
             
             # Ensure we're on the main dashboard
             if "ehub.alxafrica.com" not in self.driver.current_url:
                 self.driver.get(self.athena_base_url)  # This should be dashboard_base_url
-                time.sleep(3)
+                self._wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, self.wait_for_sel)))
             
             logger.info(f"📍 Returned to dashboard: {self.driver.current_url}")
                 
@@ -342,43 +742,37 @@ class CourseFinder:
             original_window = self.driver.current_window_handle
             
             # Look for Professional Foundations course
-            containers = self._get_course_containers()
+            container = self._find_dashboard_container("Professional Foundations", partial=True)
+            if container is None:
+                return False
             
-            for container in containers:
-                try:
-                    name = self._extract_name(container)
+            logger.info("✅ Found Savannah entry: Professional Foundations")
+            
+            button = self._find_optional("button", container)
+            if button and button.is_displayed():
+                logger.info("🚀 Clicking to enter Savannah...")
+                windows_before = len(self.driver.window_handles)
+                button.click()
+                
+                # Savannah opens in a new tab (or, rarely, the same one)
+                self._wait_until(lambda d: len(d.window_handles) > windows_before
+                                 or "savanna" in d.current_url.lower())
+                
+                # Check if new tab opened
+                if len(self.driver.window_handles) > 1:
+                    new_window = [w for w in self.driver.window_handles if w != original_window][0]
+                    self.driver.switch_to.window(new_window)
+                    self._wait_until(EC.url_contains("savanna"))
+                    logger.info(f"✅ Switched to new tab: {self.driver.current_url}")
                     
-                    if name and "Professional Foundations" in name:
-                        logger.info(f"✅ Found Savannah entry: {name}")
-                        
-                        button = container.find_element(By.CSS_SELECTOR, "button")
-                        if button and button.is_displayed():
-                            logger.info("🚀 Clicking to enter Savannah...")
-                            button.click()
-                            time.sleep(5)
-                            
-                            # Check if new tab opened
-                            if len(self.driver.window_handles) > 1:
-                                new_window = [w for w in self.driver.window_handles if w != original_window][0]
-                                self.driver.switch_to.window(new_window)
-                                logger.info(f"✅ Switched to new tab: {self.driver.current_url}")
-                                
-                                # SAVE HTML
-                                self._save_savannah_debug()
-                                
-                                # RETURN TRUE - WE ARE IN SAVANNAH!
-                                return True
-                            
-                            # Check if same tab navigation
-                            current_url = self.driver.current_url.lower()
-                            if "savanna" in current_url:
-                                logger.info(f"✅ In Savannah: {current_url}")
-                                self._save_savannah_debug()
-                                return True
-                                
-                except Exception as e:
-                    logger.debug(f"Error: {e}")
-                    continue
+                    # RETURN TRUE - WE ARE IN SAVANNAH!
+                    return True
+                
+                # Check if same tab navigation
+                current_url = self.driver.current_url.lower()
+                if "savanna" in current_url:
+                    logger.info(f"✅ In Savannah: {current_url}")
+                    return True
             
             return False
             
@@ -395,95 +789,57 @@ class CourseFinder:
         
         try:
             # Get Savannah config
-            savannah_config = self.config.get('savannah', {})
+            savannah_config = self.config.savannah_config
             selectors = savannah_config.get('selectors', {})
             
-            # Step 1: Get current selected course
-            current_course = None
-            try:
-                current_elem = self.driver.find_element(By.CSS_SELECTOR, 
-                    "#student-switch-curriculum .fs-4.fw-semibold")
-                if current_elem:
-                    current_course = current_elem.text.strip()
-                    logger.info(f"📌 Current Savannah course: {current_course}")
-            except:
-                pass
-            
-            # Step 2: Click the dropdown to reveal all courses
+            # Step 1: Click the dropdown to reveal all courses
             logger.info("🔽 Opening Savannah dropdown...")
             dropdown = self.driver.find_element(By.CSS_SELECTOR, 
                 "#student-switch-curriculum .btn-group > div")
             dropdown.click()
-            time.sleep(2)
+            self._wait_until(EC.visibility_of_element_located((By.CSS_SELECTOR,
+                ".dropdown-menu-400.fs-5.dropdown-menu li")))
+            self._wait_for_animations_end()
             
-            # Step 3: Get all course items
-            course_items = self.driver.find_elements(By.CSS_SELECTOR, 
-                ".dropdown-menu-400.fs-5.dropdown-menu li")
+            # Step 2: Get the current course and all course items - every field in one round-trip
+            result = self.driver.execute_script(SAVANNAH_ITEMS_SCRIPT,
+                ".dropdown-menu-400.fs-5.dropdown-menu li",
+                "#student-switch-curriculum .fs-4.fw-semibold") or {}
+            course_items = result.get('items') or []
+            
+            if result.get('current'):
+                logger.info(f"📌 Current Savannah course: {result['current']}")
             
             logger.info(f"📚 Found {len(course_items)} courses in Savannah dropdown")
             
-            # Step 4: Parse each course
+            # Step 3: Parse each course
             for item in course_items:
-                try:
-                    # Find the link
-                    link = item.find_element(By.CSS_SELECTOR, "a.dropdown-item")
-                    
-                    # Extract course name
-                    name = None
-                    try:
-                        name_elem = link.find_element(By.CSS_SELECTOR, 
-                            ".fs-4.fw-medium, span:first-child")
-                        name = name_elem.text.strip()
-                    except:
-                        name = link.text.split('\n')[0].strip()
-                    
-                    if not name:
-                        continue
-                    
-                    # Extract href
-                    href = link.get_attribute('href')
-                    
-                    # Extract average if available
-                    average = None
-                    try:
-                        avg_elem = link.find_element(By.CSS_SELECTOR, ".text-muted .fw-medium")
-                        if avg_elem:
-                            average = avg_elem.text.strip()
-                    except:
-                        pass
-                    
-                    # Check if this is the active course
-                    is_active = False
-                    try:
-                        item.find_element(By.CSS_SELECTOR, ".fa-check")
-                        is_active = True
-                    except:
-                        pass
-                    
-                    # Create course object
-                    course = Course(
-                        name=name,
-                        platform=Platform.SAVANNAH,
-                        description=f"Average: {average}" if average else "Savannah course",
-                        status="Current" if is_active else "Available",
-                        button_text="View Course",
-                        button_link=href,
-                        metadata={'average': average, 'is_active': is_active}
-                    )
-                    
-                    courses.append(course)
-                    logger.debug(f"✅ Parsed Savannah course: {name}")
-                    
-                except Exception as e:
-                    logger.debug(f"Failed to parse Savannah course: {e}")
+                name = item.get('name')
+                if not name:
                     continue
+                
+                average = item.get('average')
+                is_active = bool(item.get('isActive'))
+                
+                # Create course object
+                course = Course(
+                    name=name,
+                    platform=Platform.SAVANNAH,
+                    description=f"Average: {average}" if average else "Savannah course",
+                    status="Current" if is_active else "Available",
+                    button_text="View Course",
+                    button_link=item.get('href'),
+                    metadata={'average': average, 'is_active': is_active}
+                )
+                
+                courses.append(course)
+                logger.debug(f"✅ Parsed Savannah course: {name}")
             
-            # Step 5: Close dropdown
+            # Step 4: Close dropdown (the tab is closed next - nothing to wait for)
             try:
                 self.driver.find_element(By.CSS_SELECTOR, "body").click()
-                time.sleep(1)
-            except:
-                pass
+            except WebDriverException as e:
+                logger.debug(f"Could not close Savannah dropdown: {e}")
             
         except Exception as e:
             logger.error(f"Failed to parse Savannah courses: {e}")
@@ -492,32 +848,66 @@ class CourseFinder:
 
     def _extract_curriculum_id(self, href: str) -> Optional[str]:
         """Extract curriculum ID from href like /curriculums/1/observe"""
+        match = _CURRICULUM_RE.search(href) if href else None
+        return match.group(1) if match else None
+    
+    def _get_wait(self, timeout: Optional[float] = None) -> WebDriverWait:
+        """
+        Get the shared WebDriverWait for a timeout
+        
+        Args:
+            timeout: Seconds to wait (defaults to course_page.timeout)
+            
+        Returns:
+            WebDriverWait bound to this finder's driver
+        """
+        timeout = timeout or self.wait_timeout
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout)
+        return wait
+    
+    def _wait_until(self, condition, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a WebDriverWait condition instead of sleeping a fixed time
+        
+        Args:
+            condition: Expected condition or callable taking the driver
+            timeout: Seconds to wait (defaults to course_page.timeout)
+            
+        Returns:
+            bool: True if the condition was met, False on timeout
+        """
         try:
-            match = re.search(r'/curriculums/(\d+)/', href)
-            if match:
-                return match.group(1)
-        except:
-            pass
-        return None
+            self._get_wait(timeout).until(condition)
+            return True
+        except TimeoutException:
+            logger.debug(f"Timed out waiting for {getattr(condition, '__name__', condition)}")
+            return False
     
-    def _ensure_on_athena_dashboard(self):
-        """Ensure we're on the Athena dashboard page"""
-        current_url = self.driver.current_url
-        logger.debug(f"Current URL: {current_url}")
+    def _wait_for_animations_end(self, timeout: float = 3) -> bool:
+        """
+        Wait for running CSS animations (e.g. a dropdown opening) to finish
         
-        # If not on dashboard, navigate to it
-        if "ehub.alxafrica.com" not in current_url or "/login" in current_url:
-            logger.info("Navigating to Athena dashboard")
-            self.driver.get(self.athena_base_url)
-            time.sleep(3)
+        Args:
+            timeout: Seconds to wait at most
+            
+        Returns:
+            bool: True if the animations finished, False on timeout or error
+        """
+        try:
+            return bool(self.driver.execute_script(ANIMATIONS_END_SCRIPT, int(timeout * 1000)))
+        except WebDriverException as e:
+            logger.debug(f"Could not wait for animations: {e}")
+            return False
     
     def _wait_for_courses(self):
         """Wait for courses to load"""
-        timeout = self.page_config.get('timeout', 10)
-        wait_for = self.page_config.get('wait_for', '.flex.gap-6.my-4')
+        timeout = self.wait_timeout
+        wait_for = self.wait_for_sel
         
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._get_wait(timeout).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
             )
             logger.debug("✅ Courses loaded successfully")
@@ -525,375 +915,273 @@ class CourseFinder:
             logger.warning(f"⚠️ Timeout waiting for courses with selector: {wait_for}")
             # Try to scroll to trigger lazy loading
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
             # Try one more time
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
-                )
+            if self._wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for)), timeout=8):
                 logger.debug("✅ Courses loaded after scroll")
-            except:
+            else:
                 logger.warning("⚠️ Still no courses found after scrolling")
     
-    def _get_course_containers(self) -> List[WebElement]:
-        """Get all course container elements"""
-        container_selector = self.selectors.get('container', '.flex.gap-6.my-4')
+    def _build_dashboard_index(self, containers: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Map each course name to its container's position on the dashboard
+        
+        Args:
+            containers: Raw container fields in document order
+            
+        Returns:
+            Dict of course name -> container index
+        """
+        index = {}
+        for idx, data in enumerate(containers):
+            name = self._name_from_data(data)
+            if name:
+                index.setdefault(name, idx)
+        return index
+    
+    def _find_dashboard_container(self, course_name: str, partial: bool = False) -> Optional[WebElement]:
+        """
+        Look up a course container on the dashboard by name
+        
+        Uses the index built during dashboard discovery (or builds it from one
+        page snapshot) instead of reading the name of every container.
+        
+        Args:
+            course_name: Course name to find
+            partial: Match containers whose name contains course_name
+            
+        Returns:
+            Container element, or None if the course isn't on the dashboard
+        """
+        if self._dashboard_index is None:
+            self._dashboard_index = self._build_dashboard_index(self._get_course_data_from_page())
+        
+        if partial:
+            name = next((name for name in self._dashboard_index if course_name in name), None)
+        else:
+            name = course_name if course_name in self._dashboard_index else None
+        if name is None:
+            return None
+        
+        container = self._container_at(self._dashboard_index[name], name)
+        if container is None:
+            # Dashboard changed since it was indexed
+            self._dashboard_index = None
+        return container
+    
+    def _container_at(self, idx: int, course_name: str) -> Optional[WebElement]:
+        """
+        Fetch one course container by position with a single script call
+        
+        Args:
+            idx: Container index in page order
+            course_name: Name the container must show - guards against a
+                dashboard that re-ordered since the index was recorded
+            
+        Returns:
+            Container element, or None if there are fewer containers or
+            the one at idx is another course
+        """
+        result = self.driver.execute_script(COURSE_AT_SCRIPT, self.container_sel, self._script_selectors,
+                                            self.athena_base_url, idx)
+        if not result:
+            return None
+        if self._name_from_data(result['fields']) != course_name:
+            logger.debug(f"Container {idx} is no longer {course_name}")
+            return None
+        return result['element']
+    
+    def _get_course_data_from_page(self) -> List[Dict[str, Any]]:
+        """
+        Read every course container on the page in one round-trip
+        
+        COURSES_BULK_SCRIPT walks the live DOM and returns only the course
+        fields. If the script fails, the containers are parsed from a
+        page_source snapshot instead (same dict shape).
+        """
+        container_selector = self.container_sel
+        
+        try:
+            containers = self.driver.execute_script(COURSES_BULK_SCRIPT, container_selector,
+                                                    self._script_selectors, self.athena_base_url) or []
+            logger.debug(f"Found {len(containers)} elements with selector: {container_selector}")
+            return containers
+        except WebDriverException as e:
+            logger.debug(f"Bulk course extraction failed, parsing page_source: {e}")
         
         try:
-            containers = self.driver.find_elements(By.CSS_SELECTOR, container_selector)
+            containers = parse_course_containers(self.driver.page_source, container_selector,
+                                                 self._script_selectors, self.athena_base_url)
             logger.debug(f"Found {len(containers)} elements with selector: {container_selector}")
             return containers
         except Exception as e:
-            logger.error(f"Failed to get course containers: {e}")
+            logger.error(f"Failed to parse course containers: {e}")
             return []
     
-    def _parse_course(self, container: WebElement) -> Optional[Course]:
+    def _parse_course(self, data: Dict[str, Any]) -> Optional[Course]:
         """
-        Parse a single course container into a Course object
+        Parse a single course container's raw fields into a Course object
+        
+        Args:
+            data: Raw fields from parse_course_containers or COURSES_BULK_SCRIPT
         """
         try:
             # Extract basic info
-            name = self._extract_name(container)
+            name = self._name_from_data(data)
             if not name:
                 logger.debug("❌ Course name not found, skipping")
                 return None
             
             logger.debug(f"Found course: {name}")
             
-            description = self._extract_description(container)
-            date, duration = self._extract_metadata(container)
-            status = self._extract_status(container)
-            button_text, button_link = self._extract_button_info(container)
-            icon_svg = self._extract_icon(container)
+            date, duration = self._parse_metadata(data.get('metadata') or [])
+            button_text, button_link = self._parse_button(data.get('button'))
             
             # Create course object
             course = Course(
                 name=name,
                 platform=Platform.ATHENA,  # Default to Athena, will be overridden if in Savannah
-                description=description,
+                description=data.get('description'),
                 start_date=date,
                 duration=duration,
-                status=status,
+                status=self._parse_status(data),
                 button_text=button_text,
                 button_link=button_link,
-                icon_svg=icon_svg
+                icon_svg=data.get('icon')
             )
             
             logger.debug(f"✅ Successfully parsed: {course.name} [{course.status}]")
             return course
             
-        except StaleElementReferenceException:
-            logger.warning("Stale element reference, retrying...")
-            return None
         except Exception as e:
             logger.error(f"Error parsing course: {e}")
             return None
     
-    def _extract_name(self, container: WebElement) -> Optional[str]:
-        """Extract course name using multiple selectors"""
-        name_selectors = self.selectors.get('name', {})
-        
-        # Try primary selector (for mobile view)
-        primary = name_selectors.get('primary')
-        if primary:
-            try:
-                elements = container.find_elements(By.CSS_SELECTOR, primary)
-                for el in elements:
-                    if el.text and el.is_displayed():
-                        name = el.text.strip()
-                        logger.debug(f"✅ Found name with primary selector '{primary}': {name}")
-                        return name
-            except Exception as e:
-                logger.debug(f"Primary selector failed: {e}")
-        
-        # Try secondary selector (for desktop view)
-        secondary = name_selectors.get('secondary')
-        if secondary:
-            try:
-                elements = container.find_elements(By.CSS_SELECTOR, secondary)
-                for el in elements:
-                    if el.text and el.is_displayed():
-                        name = el.text.strip()
-                        logger.debug(f"✅ Found name with secondary selector '{secondary}': {name}")
-                        return name
-            except Exception as e:
-                logger.debug(f"Secondary selector failed: {e}")
-        
-        # Try fallback - look for any span with text that might be a course name
-        try:
-            spans = container.find_elements(By.CSS_SELECTOR, "span")
-            for span in spans:
-                text = span.text.strip()
-                if text and 3 < len(text) < 50 and span.is_displayed():
-                    # Check if it looks like a course name
-                    if not any(x in text.lower() for x in ['completed', 'continue', 'start', 'weeks', 'months']):
-                        logger.debug(f"✅ Found name with fallback span: {text}")
-                        return text
-        except:
-            pass
-        
-        return None
-    
-    def _extract_description(self, container: WebElement) -> Optional[str]:
-        """Extract course description"""
-        selector = self.selectors.get('description', 'p.text-sm.text-popover-foreground')
+    def _name_from_data(self, data: Dict[str, Any]) -> Optional[str]:
+        """Pick the course name: primary (mobile), secondary (desktop), then any likely span"""
+        for key in ('primary', 'secondary'):
+            name = data.get(key)
+            if name:
+                logger.debug(f"✅ Found name with {key} selector: {name}")
+                return name
         
-        try:
-            elements = container.find_elements(By.CSS_SELECTOR, selector)
-            for el in elements:
-                if el.text and el.is_displayed():
-                    desc = el.text.strip()
-                    logger.debug(f"Found description: {desc[:50]}...")
-                    return desc
-        except:
-            pass
+        # Fallback - look for any span with text that might be a course name
+        for text in data.get('spans') or []:
+            if 3 < len(text) < 50:
+                # Check if it looks like a course name
+                if not _NAME_REJECT_RE.search(text):
+                    logger.debug(f"✅ Found name with fallback span: {text}")
+                    return text
         
         return None
     
-    def _extract_metadata(self, container: WebElement) -> Tuple[Optional[str], Optional[str]]:
-        """Extract date and duration"""
-        metadata_config = self.selectors.get('metadata', {})
-        container_selector = metadata_config.get('container', '.flex.flex-wrap.gap-1.items-center')
-        
+    def _parse_metadata(self, texts: List[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Extract date and duration from the metadata container texts"""
         date = None
         duration = None
         
-        try:
-            # Find metadata container
-            meta_containers = container.find_elements(By.CSS_SELECTOR, container_selector)
-            
-            for meta in meta_containers:
-                text = meta.text
-                if not text:
-                    continue
-                
-                logger.debug(f"Metadata text: {text}")
-                
-                # Try to extract date (looks like "DD MMM YYYY")
-                date_match = re.search(r'(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})', text)
-                if date_match and not date:
-                    date = date_match.group(1)
-                    logger.debug(f"Found date: {date}")
-                
-                # Try to extract duration (looks like "X weeks" or "X months")
-                duration_match = re.search(r'(\d+\s+(week|month|year)s?)', text, re.IGNORECASE)
-                if duration_match and not duration:
-                    duration = duration_match.group(1)
-                    logger.debug(f"Found duration: {duration}")
-            
-        except Exception as e:
-            logger.debug(f"Failed to extract metadata: {e}")
+        for text in texts:
+            if not text:
+                continue
+            
+            logger.debug(f"Metadata text: {text}")
+            
+            # Try to extract date (looks like "DD MMM YYYY")
+            date_match = _DATE_RE.search(text)
+            if date_match and not date:
+                date = date_match.group(1)
+                logger.debug(f"Found date: {date}")
+            
+            # Try to extract duration (looks like "X weeks" or "X months")
+            duration_match = _DURATION_RE.search(text)
+            if duration_match and not duration:
+                duration = duration_match.group(1)
+                logger.debug(f"Found duration: {duration}")
         
         return date, duration
     
-    def _extract_status(self, container: WebElement) -> str:
+    def _parse_status(self, data: Dict[str, Any]) -> str:
         """Extract course status (Completed, In Progress, etc.)"""
-        status_config = self.selectors.get('status_badge', {})
-        selector = status_config.get('selector', '.text-success')
-        completed_text = status_config.get('completed_text', 'Completed')
-        
-        try:
-            # Check for status badge
-            badges = container.find_elements(By.CSS_SELECTOR, selector)
-            for badge in badges:
-                if badge.is_displayed() and completed_text in badge.text:
-                    logger.debug("Found Completed status")
-                    return "Completed"
-        except:
-            pass
+        # Check for status badge
+        completed_text = self.completed_text
+        if any(completed_text in badge for badge in data.get('badges') or []):
+            logger.debug("Found Completed status")
+            return "Completed"
         
         # Check button text for status clues
-        try:
-            button = container.find_element(By.CSS_SELECTOR, "button")
-            if button and button.is_displayed():
-                button_text = button.text.lower()
-                if 'continue' in button_text:
-                    logger.debug("Found In Progress status (Continue button)")
-                    return "In Progress"
-                elif 'start' in button_text:
-                    logger.debug("Found Not Started status (Start button)")
-                    return "Not Started"
-        except:
-            pass
+        button_text = (data.get('firstButtonText') or '').lower()
+        if 'continue' in button_text:
+            logger.debug("Found In Progress status (Continue button)")
+            return "In Progress"
+        elif 'start' in button_text:
+            logger.debug("Found Not Started status (Start button)")
+            return "Not Started"
         
         return "Unknown"
     
-    def _extract_button_info(self, container: WebElement) -> Tuple[Optional[str], Optional[str]]:
+    def _parse_button(self, button: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
         """Extract button text and link using multiple strategies"""
-        try:
-            # Find button
-            buttons = container.find_elements(By.CSS_SELECTOR, "button")
-            
-            for button in buttons:
-                if not button.is_displayed():
-                    continue
-                
-                button_text = button.text.strip() if button.text else None
-                logger.debug(f"Found button: {button_text}")
-                
-                # Try multiple strategies to extract URL
-                url = self._extract_url_from_attributes(button)
-                if url:
-                    return button_text, url
-                
-                # Check onclick
-                onclick = button.get_attribute('onclick')
-                if onclick:
-                    url = self._extract_url_from_onclick(onclick)
-                    if url:
-                        return button_text, url
-                
-                # Check parent link
-                url = self._extract_url_from_parent(button)
-                if url:
-                    return button_text, url
-                
-                return button_text, None
-                
-        except Exception as e:
-            logger.debug(f"Failed to extract button info: {e}")
+        if not button:
+            return None, None
         
-        return None, None
-    
-    def _extract_icon(self, container: WebElement) -> Optional[str]:
-        """Extract icon SVG as string"""
-        try:
-            # Try to find SVG icon
-            icons = container.find_elements(By.CSS_SELECTOR, "svg")
-            for icon in icons:
-                if icon.is_displayed():
-                    # Get the SVG as string
-                    return icon.get_attribute('outerHTML')
-        except Exception as e:
-            logger.debug(f"Failed to extract icon: {e}")
+        button_text = button.get('text') or None
+        logger.debug(f"Found button: {button_text}")
         
-        return None
-
-    def _extract_url_from_attributes(self, element: WebElement) -> Optional[str]:
-        """Check all element attributes for URL-like values"""
-        try:
-            # Get all attributes using JavaScript
-            attrs = self.driver.execute_script("""
-                var attrs = {};
-                for (var i = 0; i < arguments[0].attributes.length; i++) {
-                    var attr = arguments[0].attributes[i];
-                    attrs[attr.name] = attr.value;
-                }
-                return attrs;
-            """, element)
-            
-            # List of attribute names that might contain URLs
-            url_attrs = [
-                'data-url', 'data-href', 'data-link', 'data-path',
-                'data-course-url', 'data-redirect', 'data-target',
-                'href', 'data-src', 'data-action'
-            ]
-            
-            for attr_name, attr_value in attrs.items():
-                # Check if attribute name contains URL-related keywords
-                if any(url_attr in attr_name.lower() for url_attr in ['url', 'href', 'link', 'path', 'redirect']):
-                    if attr_value and len(attr_value) > 5:
-                        url = attr_value.strip()
-                        if url.startswith('/'):
-                            url = f"{self.athena_base_url}{url}"
-                        return url
-                
-                # Check if attribute value looks like a URL
-                if attr_value and isinstance(attr_value, str):
-                    if attr_value.startswith(('http', '/', './', '../')):
-                        if attr_value.startswith('/'):
-                            attr_value = f"{self.athena_base_url}{attr_value}"
-                        return attr_value
-                        
-        except Exception as e:
-            logger.debug(f"Error extracting attributes: {e}")
+        # URL-like attribute, already resolved by the extractor
+        url = button.get('url')
+        if url:
+            return button_text, url
         
-        return None
-    
+        # Check onclick
+        onclick = button.get('onclick')
+        if onclick:
+            url = self._extract_url_from_onclick(onclick)
+            if url:
+                return button_text, url
+        
+        # Check parent link
+        href = button.get('parentHref')
+        if href and href != '#' and 'javascript:' not in href:
+            return button_text, href
+        
+        return button_text, None
+
     def _extract_url_from_onclick(self, onclick: str) -> Optional[str]:
         """Extract URL from onclick attribute"""
-        patterns = [
-            r"['\"](/[^'\"]*)['\"]",
-            r"['\"](https?://[^'\"]*)['\"]",
-            r"window\.location[= ]+['\"]([^'\"]*)['\"]",
-            r"location\.href[= ]+['\"]([^'\"]*)['\"]"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, onclick)
-            if match:
-                url = match.group(1)
-                if url.startswith('/'):
-                    url = f"{self.athena_base_url}{url}"
-                return url
-        
-        return None
-    
-    def _extract_url_from_parent(self, element: WebElement) -> Optional[str]:
-        """Check if element is inside a link"""
-        try:
-            parent_link = element.find_element(By.XPATH, './ancestor::a')
-            href = parent_link.get_attribute('href')
-            if href and href != '#' and 'javascript:' not in href:
-                return href
-        except:
-            pass
+        match = _ONCLICK_URL_RE.search(onclick)
+        if not match:
+            return None
         
-        return None
-    
-    def _save_athena_debug(self):
-        """Save Athena page HTML for analysis"""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            html_file = self.athena_debug_dir / f"athena_page_{timestamp}.html"
-            
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            
-            logger.info(f"📄 Athena debug HTML saved: {html_file}")
-            
-        except Exception as e:
-            logger.warning(f"Failed to save Athena debug HTML: {e}")
+        url = match.group('rel') or match.group('abs') or match.group('wl') or match.group('lh') or ''
+        if url.startswith('/'):
+            url = f"{self.athena_base_url}{url}"
+        return url
     
     def _save_savannah_debug(self):
         """Save Savannah page HTML for analysis"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            html_file = self.savannah_debug_dir / f"savannah_page_{timestamp}.html"
-            screenshot_file = self.savannah_debug_dir / f"savannah_page_{timestamp}.png"
+            timestamp = self._capture_stamp()
+            base_path = self.savannah_debug_dir / f"savannah_page_{timestamp}"
             
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            logger.info(f"📄 Savannah HTML saved: {html_file}")
+            screenshot_future = save_screenshot_async(self.driver, base_path)
             
-            self.driver.save_screenshot(str(screenshot_file))
-            logger.info(f"📸 Savannah screenshot saved: {screenshot_file}")
+            html_file = save_page_snapshot(self.driver, base_path)
+            logger.info(f"📄 Savannah HTML saved: {html_file}")
             
             logger.info(f"📍 Savannah URL: {self.driver.current_url}")
             logger.info(f"📌 Savannah title: {self.driver.title}")
             
+            logger.info(f"📸 Savannah screenshot saved: {screenshot_future.result(timeout=SCREENSHOT_TIMEOUT)}")
+            
         except Exception as e:
             logger.warning(f"Failed to save Savannah debug: {e}")
     
     def _save_discovery_report(self, courses: List[Course]):
         """Save comprehensive discovery report"""
         try:
-            report_dir = Path("data/discovery_reports")
-            report_dir.mkdir(parents=True, exist_ok=True)
-            
-            report = {
-                'timestamp': datetime.now().isoformat(),
-                'total_courses': len(courses),
-                'by_platform': {
-                    'athena': len([c for c in courses if c.platform == Platform.ATHENA]),
-                    'savannah': len([c for c in courses if c.platform == Platform.SAVANNAH])
-                },
-                'courses': [c.to_dict() for c in courses]
-            }
-            
-            filename = report_dir / f"discovery_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2)
+            # Same single-pass counts and serialization as a saved course list,
+            # plus the icons when they were captured
+            filename = self.discovery_report_dir / f"discovery_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            CourseList(courses).save_to_file(filename, pretty=True, include_heavy=self.capture_icons)
             
             logger.info(f"📄 Discovery report saved: {filename}")
             
@@ -913,22 +1201,25 @@ class CourseFinder:
                 self.driver.get(course.full_url)
                 return True
             
-            # Otherwise find and click the button
-            containers = self._get_course_containers()
-            
-            for container in containers:
-                name = self._extract_name(container)
-                if name == course.name:
-                    button = container.find_element(By.CSS_SELECTOR, "button")
-                    if button and button.is_displayed():
-                        logger.debug(f"Clicking button for {course.name}")
-                        button.click()
-                        time.sleep(3)
-                        
-                        # Store the URL
-                        course.button_link = self.driver.current_url
-                        logger.info(f"✅ Navigated to: {course.button_link}")
-                        return True
+            # Otherwise find and click the button - by the position recorded at discovery if known
+            idx = course.metadata.get('container_index')
+            container = self._container_at(idx, course.name) if idx is not None else None
+            if container is None:
+                # Moved or gone since discovery - look it up by name on a fresh index
+                self._dashboard_index = None
+                container = self._find_dashboard_container(course.name)
+            if container is not None:
+                button = self._find_optional("button", container)
+                if button and button.is_displayed():
+                    logger.debug(f"Clicking button for {course.name}")
+                    url_before = self.driver.current_url
+                    button.click()
+                    self._wait_until(EC.url_changes(url_before))
+                    
+                    # Store the URL
+                    course.button_link = self.driver.current_url
+                    logger.info(f"✅ Navigated to: {course.button_link}")
+                    return True
             
             logger.warning(f"Could not find container for {course.name}")
             return False
@@ -947,30 +1238,31 @@ class CourseFinder:
             print("   No courses found!")
             return
         
-        # Group by platform
-        athena_courses = [c for c in course_list if c.platform == Platform.ATHENA]
-        savannah_courses = [c for c in course_list if c.platform == Platform.SAVANNAH]
-        
-        if athena_courses:
-            print(f"\n🏛️  ATHENA PLATFORM ({len(athena_courses)} courses):")
-            print("-" * 70)
-            for i, course in enumerate(athena_courses, 1):
-                status_color = "✅" if course.status == "Completed" else "🔄" if course.status == "In Progress" else "⏳"
-                accessible = "🔗" if course.is_accessible else "🚫"
-                print(f"   {accessible} {status_color}  {i}. {course.name}")
-                if course.full_url:
-                    print(f"       URL: {course.full_url}")
-        
-        if savannah_courses:
-            print(f"\n🌿 SAVANNAH PLATFORM ({len(savannah_courses)} courses):")
-            print("-" * 70)
-            for i, course in enumerate(savannah_courses, 1):
-                status_color = "✅" if course.status == "Completed" else "🔄" if course.status == "In Progress" else "⏳"
-                accessible = "🔗" if course.is_accessible else "🚫"
-                print(f"   {accessible} {status_color}  {i}. {course.name}")
-                if course.full_url:
-                    print(f"       URL: {course.full_url}")
+        # Group by platform in one pass
+        athena_courses, savannah_courses = [], []
+        for course in course_list.courses:
+            if course.platform == Platform.ATHENA:
+                athena_courses.append(course)
+            elif course.platform == Platform.SAVANNAH:
+                savannah_courses.append(course)
+        
+        self._print_platform_courses("🏛️  ATHENA PLATFORM", athena_courses)
+        self._print_platform_courses("🌿 SAVANNAH PLATFORM", savannah_courses)
         
         print("\n" + "="*70)
         print(f"✅ Total: {len(course_list)} courses ({len(athena_courses)} Athena, {len(savannah_courses)} Savannah)")
-        print("="*70)
\ No newline at end of file
+        print("="*70)
+    
+    def _print_platform_courses(self, title: str, courses: List[Course]):
+        """Print one platform's section of the summary (nothing when empty)"""
+        if not courses:
+            return
+        
+        print(f"\n{title} ({len(courses)} courses):")
+        print("-" * 70)
+        for i, course in enumerate(courses, 1):
+            status_icon = STATUS_ICONS.get(course.status, "⏳")
+            accessible = "🔗" if course.is_accessible else "🚫"
+            print(f"   {accessible} {status_icon}  {i}. {course.name}")
+            if course.full_url:
+                print(f"       URL: {course.full_url}")
\ No newline at end of file
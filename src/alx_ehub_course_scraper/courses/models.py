@@ -3,7 +3,8 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
-import json
+from pathlib import Path
+import orjson
 
 class Platform(Enum):
     """Supported platforms"""
@@ -12,7 +13,22 @@ class Platform(Enum):
     SAVANNAH = "savannah"
     UNKNOWN = "unknown"
 
-@dataclass
+# Site a platform's relative links resolve against
+_DEFAULT_BASE_URL = "https://ehub.alxafrica.com"
+_PLATFORM_BASES: Dict[Platform, str] = {
+    Platform.SAVANNAH: "https://savannah.alxafrica.com",
+    Platform.ATHENA: _DEFAULT_BASE_URL,
+    Platform.DASHBOARD: _DEFAULT_BASE_URL,
+    Platform.UNKNOWN: _DEFAULT_BASE_URL,
+}
+
+# Console icon per course status - anything else shows as pending
+STATUS_ICONS = {"Completed": "✅", "In Progress": "🔄"}
+
+# Name -> course_id: spaces and hyphens become underscores in one pass
+_COURSE_ID_TRANS = str.maketrans({' ': '_', '-': '_'})
+
+@dataclass(slots=True)
 class Course:
     """Course data model with platform info"""
     name: str
@@ -30,30 +46,32 @@ class Course:
     
     def __post_init__(self):
         if not self.course_id and self.name:
-            self.course_id = self.name.lower().replace(' ', '_').replace('-', '_')
+            self.course_id = self.name.lower().translate(_COURSE_ID_TRANS)
     
     @property
     def is_accessible(self) -> bool:
         """Check if course has a working link"""
-        return bool(self.button_link) and self.button_link != "#" and "javascript:void" not in self.button_link
+        link = self.button_link
+        return bool(link) and link != "#" and "javascript:void" not in link
     
     @property
     def full_url(self) -> Optional[str]:
         """Get full URL with correct base domain"""
-        if not self.button_link:
+        link = self.button_link
+        if not link:
             return None
-        if self.button_link.startswith('http'):
-            return self.button_link
-        if self.button_link.startswith('/'):
-            if self.platform == Platform.SAVANNAH:
-                return f"https://savannah.alxafrica.com{self.button_link}"
-            else:
-                return f"https://ehub.alxafrica.com{self.button_link}"
-        return self.button_link
+        if link.startswith('/'):
+            return f"{_PLATFORM_BASES.get(self.platform, _DEFAULT_BASE_URL)}{link}"
+        return link
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization"""
-        return {
+    def to_dict(self, include_heavy: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization
+        
+        Args:
+            include_heavy: Also include large fields (the icon SVG markup)
+        """
+        data = {
             'name': self.name,
             'platform': self.platform.value,
             'description': self.description,
@@ -66,11 +84,14 @@ class Course:
             'course_id': self.course_id,
             'is_accessible': self.is_accessible
         }
+        if include_heavy:
+            data['icon_svg'] = self.icon_svg
+        return data
     
     def __repr__(self) -> str:
         return f"Course(name='{self.name}', platform={self.platform.value}, status='{self.status}')"
 
-@dataclass
+@dataclass(slots=True)
 class CourseList:
     """Collection of courses with helper methods"""
     courses: List[Course] = field(default_factory=list)
@@ -94,20 +115,50 @@ class CourseList:
         """Filter courses by status"""
         return [c for c in self.courses if c.status == status]
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+    def summary(self) -> Dict[str, int]:
+        """Count total, accessible, completed and in-progress courses in a single pass"""
+        counts = {'total': len(self.courses), 'accessible': 0, 'Completed': 0, 'In Progress': 0}
+        for course in self.courses:
+            if course.is_accessible:
+                counts['accessible'] += 1
+            if course.status in ('Completed', 'In Progress'):
+                counts[course.status] += 1
+        return counts
+    
+    def to_dict(self, include_heavy: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary, counting and serializing in a single pass
+        
+        Args:
+            include_heavy: Include large course fields (see Course.to_dict)
+        """
+        accessible = 0
+        by_platform = {'athena': 0, 'savannah': 0}
+        courses = []
+        
+        for course in self.courses:
+            accessible += course.is_accessible
+            platform = course.platform.value
+            if platform in by_platform:
+                by_platform[platform] += 1
+            courses.append(course.to_dict(include_heavy))
+        
         return {
             'timestamp': self.timestamp.isoformat(),
             'total_courses': len(self.courses),
-            'accessible_courses': len(self.accessible_courses()),
-            'by_platform': {
-                'athena': len(self.by_platform(Platform.ATHENA)),
-                'savannah': len(self.by_platform(Platform.SAVANNAH))
-            },
-            'courses': [c.to_dict() for c in self.courses]
+            'accessible_courses': accessible,
+            'by_platform': by_platform,
+            'courses': courses
         }
     
-    def save_to_file(self, filepath: str):
-        """Save course list to JSON file"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
\ No newline at end of file
+    def save_to_file(self, filepath: str, pretty: bool = False, include_heavy: bool = False):
+        """
+        Save course list to JSON file
+        
+        Args:
+            filepath: Output path
+            pretty: Indent the JSON for reading/diffing (compact by default)
+            include_heavy: Include large course fields (see Course.to_dict)
+        """
+        option = orjson.OPT_INDENT_2 if pretty else None
+        Path(filepath).write_bytes(orjson.dumps(self.to_dict(include_heavy), option=option))
\ No newline at end of file
@@ -0,0 +1,147 @@
+# src/alx_ehub_course_scraper/courses/page_parser.py
+import re
+import logging
+from typing import List, Optional, Dict, Any
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+# Create logger
+logger = logging.getLogger(__name__)
+
+def parse_course_containers(html: str, container_selector: str,
+                            selectors: Dict[str, Optional[str]], base_url: str) -> List[Dict[str, Any]]:
+    """
+    Parse every course container from a page snapshot in-process
+    
+    Returns the same dict shape as COURSES_BULK_SCRIPT, so it can stand
+    in for the script when it can't run. A static
+    snapshot has no layout, so the first match is used where the script
+    checks visibility (mobile and desktop variants carry the same text).
+    
+    Args:
+        html: Page HTML (driver.page_source)
+        container_selector: CSS selector for course containers
+        selectors: Field selectors (primary, secondary, description, metadata, badge, icon)
+        base_url: Base for resolving relative links
+        
+    Returns:
+        List of raw course data dicts, in page order
+    """
+    soup = BeautifulSoup(html, "lxml")
+    return [_container_data(node, selectors, base_url) for node in soup.select(container_selector)]
+
+# Attribute names that usually carry a button's target
+URL_ATTRIBUTE_KEYWORDS = ('url', 'href', 'link', 'path', 'redirect')
+_URL_ATTRIBUTE_RE = re.compile('|'.join(URL_ATTRIBUTE_KEYWORDS), re.IGNORECASE)
+
+# Attributes checked first, in this order, before scanning the rest
+PREFERRED_URL_ATTRIBUTES = (
+    'data-url', 'data-href', 'data-link', 'data-path',
+    'data-course-url', 'data-redirect', 'data-target',
+    'href', 'data-src', 'data-action'
+)
+_PREFERRED_URL_ATTRIBUTE_SET = frozenset(PREFERRED_URL_ATTRIBUTES)
+
+def _url_value(attr_name: str, attr_value: Optional[str], base_url: str) -> Optional[str]:
+    """URL carried by one attribute, or None if it doesn't look like one"""
+    if not attr_value:
+        return None
+    
+    # Check if attribute name contains URL-related keywords
+    if len(attr_value) > 5 and _URL_ATTRIBUTE_RE.search(attr_name):
+        url = attr_value.strip()
+        return f"{base_url}{url}" if url.startswith('/') else url
+    
+    # Check if attribute value looks like a URL
+    if attr_value.startswith(('http', '/', './', '../')):
+        return f"{base_url}{attr_value}" if attr_value.startswith('/') else attr_value
+    
+    return None
+
+def attribute_url(attrs: Dict[str, str], base_url: str) -> Optional[str]:
+    """
+    Find the first URL-like attribute value of an element
+    
+    Same rules as the button lookup in COURSES_BULK_SCRIPT: a URL-ish
+    attribute name with a non-trivial value, or any value that looks like
+    a link. PREFERRED_URL_ATTRIBUTES are tried first; the remaining
+    attributes are only scanned if none of them matched. Site-relative
+    values are prefixed with base_url.
+    
+    Args:
+        attrs: Attribute name -> value
+        base_url: Base for site-relative links
+        
+    Returns:
+        URL, or None if no attribute looks like one
+    """
+    for attr_name in PREFERRED_URL_ATTRIBUTES:
+        url = _url_value(attr_name, attrs.get(attr_name), base_url)
+        if url:
+            return url
+    
+    for attr_name, attr_value in attrs.items():
+        if attr_name in _PREFERRED_URL_ATTRIBUTE_SET:
+            continue
+        url = _url_value(attr_name, attr_value, base_url)
+        if url:
+            return url
+    
+    return None
+
+def _select(node: Tag, selector: Optional[str]) -> List[Tag]:
+    """Select descendants, treating a missing or unsupported selector as no match"""
+    if not selector:
+        return []
+    try:
+        return node.select(selector)
+    except Exception as e:
+        logger.debug(f"Selector '{selector}' not supported: {e}")
+        return []
+
+def _text(node: Tag) -> str:
+    """Whitespace-normalized text of a node"""
+    return node.get_text(" ", strip=True)
+
+def _first_text(node: Tag, selector: Optional[str]) -> Optional[str]:
+    """Text of the first non-empty match"""
+    for match in _select(node, selector):
+        text = _text(match)
+        if text:
+            return text
+    return None
+
+def _container_data(node: Tag, selectors: Dict[str, Optional[str]], base_url: str) -> Dict[str, Any]:
+    """Extract raw fields of one course container"""
+    buttons = node.select("button")
+    button_data = None
+    if buttons:
+        button = buttons[0]
+        attrs = {
+            name: " ".join(value) if isinstance(value, list) else value
+            for name, value in button.attrs.items()
+        }
+        parent = button.find_parent("a")
+        parent_href = urljoin(base_url, parent["href"]) if parent and parent.get("href") else None
+        button_data = {
+            'text': _text(button),
+            'url': attribute_url(attrs, base_url),
+            'onclick': attrs.get('onclick'),
+            'parentHref': parent_href
+        }
+    
+    icon = next((match for match in _select(node, selectors.get('icon')) if not match.has_attr('hidden')), None)
+    
+    return {
+        'primary': _first_text(node, selectors.get('primary')),
+        'secondary': _first_text(node, selectors.get('secondary')),
+        'spans': [text for text in (_text(span) for span in node.select("span")) if text],
+        'description': _first_text(node, selectors.get('description')),
+        'metadata': [_text(meta) for meta in _select(node, selectors.get('metadata'))],
+        'badges': [_text(badge) for badge in _select(node, selectors.get('badge'))],
+        'firstButtonText': _text(buttons[0]) if buttons else None,
+        'button': button_data,
+        'icon': str(icon) if icon else None
+    }
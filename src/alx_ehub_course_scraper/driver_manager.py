@@ -16,15 +16,21 @@ from .config import Config
 class DriverManager:
     """Manages WebDriver setup for Windows browsers"""
     
-    def __init__(self):
+    def __init__(self, config: Optional[Config] = None):
         self.driver: Optional[webdriver.Remote] = None
-        self.config = Config()
+        self.config = config or Config()
         self.supported_browsers = ['chrome', 'firefox']
         
-    def get_driver(self, browser: Optional[str] = None, headless: Optional[bool] = None, stealth: bool = False) -> webdriver.Remote:
+        # One persistent HTTP connection pool to the driver for every command
+        self.keep_alive = self.config.data['browser_defaults'].get('keep_alive', True)
+        
+    def get_driver(self, browser: Optional[str] = None, headless: Optional[bool] = None, stealth: bool = False,
+                   scraping_profile: Optional[bool] = None) -> webdriver.Remote:
         """Get WebDriver for Windows browsers"""
         browser = browser or self.config.default_browser
         headless = headless if headless is not None else self.config.headless_mode
+        profile_config = self.config.data['browser_defaults'].get('scraping_profile', {})
+        scraping_profile = scraping_profile if scraping_profile is not None else profile_config.get('enabled', False)
         
         browser = browser.lower()
         
@@ -32,13 +38,14 @@ class DriverManager:
             raise ValueError(f"Browser '{browser}' not supported. Available: {self.supported_browsers}")
         
         if browser == 'chrome':
-            return self._get_chrome_driver(headless, stealth)
+            return self._get_chrome_driver(headless, stealth, scraping_profile)
         elif browser == 'firefox':
-            return self._get_firefox_driver(headless, stealth)
+            return self._get_firefox_driver(headless, stealth, scraping_profile)
         else:
             raise ValueError(f"Unsupported browser: {browser}")
     
-    def _get_chrome_driver(self, headless: bool = False, stealth: bool = False) -> webdriver.Chrome:
+    def _get_chrome_driver(self, headless: bool = False, stealth: bool = False,
+                           scraping_profile: bool = False) -> webdriver.Chrome:
         """Setup Chrome driver for Windows with proper error handling"""
         options = ChromeOptions()
         
@@ -54,8 +61,17 @@ class DriverManager:
         window_size = self.config.data['browser_defaults']['window_size']
         options.add_argument(f'--window-size={window_size["width"]},{window_size["height"]}')
         
+        # Scraping profile - skip images, extensions and background traffic
+        if scraping_profile:
+            profile_config = self.config.data['browser_defaults'].get('scraping_profile', {})
+            for argument in profile_config.get('chrome_arguments', []):
+                options.add_argument(argument)
+            options.add_experimental_option("prefs", profile_config.get('chrome_prefs', {}))
+            # 'eager' returns from get() at DOMContentLoaded, not after every asset
+            options.page_load_strategy = profile_config.get('page_load_strategy', 'normal')
+        
         # Anti-detection options
-        if stealth or self.config.data['browser_defaults']['stealth_mode']:
+        if stealth or self.config.stealth_mode:
             options.add_argument('--disable-blink-features=AutomationControlled')
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
@@ -69,7 +85,8 @@ class DriverManager:
         if self._is_driver_valid(driver_path):
             print("✅ Using existing ChromeDriver")
             service = ChromeService(str(driver_path))
-            driver = webdriver.Chrome(service=service, options=options)
+            driver = webdriver.Chrome(service=service, options=options, keep_alive=self.keep_alive)
+            self._configure_connection_pool(driver)
             self.driver = driver
             return driver
         
@@ -113,11 +130,12 @@ class DriverManager:
             raise
         
         service = ChromeService(str(driver_path))
-        driver = webdriver.Chrome(service=service, options=options)
+        driver = webdriver.Chrome(service=service, options=options, keep_alive=self.keep_alive)
         
-        if stealth or self.config.data['browser_defaults']['stealth_mode']:
+        if stealth or self.config.stealth_mode:
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        self._configure_connection_pool(driver)
         self.driver = driver
         return driver
 
@@ -133,12 +151,13 @@ class DriverManager:
             
             if result.returncode == 0 and '144.0.7559' in result.stdout:
                 return True
-        except:
+        except (OSError, subprocess.SubprocessError):
             pass
         
         return False
     
-    def _get_firefox_driver(self, headless: bool = False, stealth: bool = False) -> webdriver.Firefox:
+    def _get_firefox_driver(self, headless: bool = False, stealth: bool = False,
+                            scraping_profile: bool = False) -> webdriver.Firefox:
         """Setup Firefox driver for Windows"""
         options = FirefoxOptions()
         
@@ -152,20 +171,52 @@ class DriverManager:
         # Add this to ensure proper window size
         options.set_preference("layout.css.devPixelsPerPx", "1.0")
         
-        if stealth or self.config.data['browser_defaults']['stealth_mode']:
+        if scraping_profile:
+            profile_config = self.config.data['browser_defaults'].get('scraping_profile', {})
+            for name, value in profile_config.get('firefox_prefs', {}).items():
+                options.set_preference(name, value)
+            options.page_load_strategy = profile_config.get('page_load_strategy', 'normal')
+        
+        if stealth or self.config.stealth_mode:
             options.set_preference("dom.webdriver.enabled", False)
             options.set_preference('useAutomationExtension', False)
             options.set_preference("general.useragent.override", 
                                  "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0")
         
-        cache_path = self.config.get_driver_cache_path('firefox')
-        os.environ['WDM_LOCAL_CACHE'] = cache_path
-        
-        service = FirefoxService(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service, options=options)
+        # Reuse the resolved geckodriver - install() does a version lookup over the network
+        driver_path = self.config.get_cached_driver_path('firefox')
+        if not driver_path:
+            cache_path = self.config.get_driver_cache_path('firefox')
+            os.environ['WDM_LOCAL_CACHE'] = cache_path
+            driver_path = GeckoDriverManager().install()
+            self.config.cache_driver_path('firefox', driver_path)
+        
+        service = FirefoxService(driver_path)
+        driver = webdriver.Firefox(service=service, options=options, keep_alive=self.keep_alive)
+        self._configure_connection_pool(driver)
         self.driver = driver
         return driver
     
+    def _configure_connection_pool(self, driver: webdriver.Remote) -> None:
+        """Widen the keep-alive connection pool so parallel driver commands don't serialize"""
+        pool_maxsize = self.config.data['browser_defaults'].get('pool_maxsize', 1)
+        executor = driver.command_executor
+        
+        # Without keep-alive every command opens its own connection anyway
+        if pool_maxsize <= 1 or not getattr(executor, 'keep_alive', False):
+            return
+        
+        # Selenium exposes no public setting for this - the pool manager is
+        # private, so skip quietly if a Selenium release reshapes it
+        conn = getattr(executor, '_conn', None)
+        pool_kw = getattr(conn, 'connection_pool_kw', None)
+        if not isinstance(pool_kw, dict) or not hasattr(conn, 'clear'):
+            return
+        
+        # New pools pick up the size; drop the maxsize=1 pool created at session start
+        pool_kw['maxsize'] = pool_maxsize
+        conn.clear()
+    
     def close_driver(self) -> None:
         """Close the current driver with proper error handling"""
         if self.driver:
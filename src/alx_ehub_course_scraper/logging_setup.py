@@ -0,0 +1,124 @@
+"""
+Logging setup
+Configures the root logger once per process
+"""
+import os
+import sys
+import atexit
+import queue
+import logging
+import logging.handlers
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+from ._env import load_env
+
+# Set once the root logger is configured - repeat calls reuse it
+_listener: Optional[logging.handlers.QueueListener] = None
+# Process that started _listener - a forked child inherits the object but not its thread
+_listener_pid: Optional[int] = None
+
+class ConsoleFormatter(logging.Formatter):
+    """
+    Stream formatter for user-facing status lines
+    
+    Records logged with extra={'ui': '<icon>'} print as a bare
+    "<icon> message" line on the console, replacing a separate print().
+    The file handler keeps its own formatter, so log files get the
+    plain timestamped message without the icon.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        icon = getattr(record, 'ui', None)
+        if icon is None:
+            return super().format(record)
+        return f"{icon} {record.getMessage()}"
+
+def setup_logging(name: str = "alx_ehub_course_scraper") -> logging.Logger:
+    """
+    Configure logging for the entire application
+    
+    Safe to call more than once: later calls return a logger without
+    adding handlers, so records are never emitted twice. A forked worker
+    process gets its own listener on its first call.
+    
+    Args:
+        name: Name of the logger to return
+    
+    Returns:
+        Logger instance
+    """
+    global _listener, _listener_pid
+    
+    if _listener is not None and _listener_pid == os.getpid():
+        return logging.getLogger(name)
+    
+    # DEBUG_MODE may live in .env, which Config hasn't loaded yet
+    load_env()
+    debug_mode = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+    
+    # Create logs directory
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    
+    # Create log filename with timestamp
+    log_file = log_dir / f"scraper_{datetime.now().strftime('%Y%m%d')}.log"
+    
+    # Configure logging format
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    date_format = '%Y-%m-%d %H:%M:%S'
+    
+    formatter = logging.Formatter(log_format, datefmt=date_format)
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(ConsoleFormatter(log_format, datefmt=date_format))
+    
+    # The file handler writes from a background thread - logging calls only
+    # enqueue. The console handler stays synchronous so status lines keep
+    # their order relative to print() and input() prompts
+    log_queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _listener.start()
+    _listener_pid = os.getpid()
+    atexit.register(shutdown_logging)
+    
+    # QueueHandler pre-renders the message; keep it bare so the file
+    # handler adds the only "asctime - name - level" prefix
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # Configure root logger, replacing any handlers registered before us
+    logging.basicConfig(
+        level=logging.DEBUG if debug_mode else logging.INFO,
+        handlers=[queue_handler, stream_handler],
+        force=True
+    )
+    
+    # Set third-party loggers to WARNING to reduce noise
+    logging.getLogger("selenium").setLevel(logging.WARNING)
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("webdriver_manager").setLevel(logging.WARNING)
+    
+    logger = logging.getLogger(name)
+    logger.info("=" * 60)
+    logger.info("LOGGING CONFIGURED SUCCESSFULLY")
+    logger.info(f"Log file: {log_file}")
+    logger.info("=" * 60)
+    
+    return logger
+
+def shutdown_logging() -> None:
+    """
+    Write out queued records and stop the background listener
+    
+    Runs at exit; worker processes that may skip atexit call it directly.
+    A later setup_logging() call starts a fresh listener.
+    """
+    global _listener, _listener_pid
+    
+    if _listener is not None and _listener_pid == os.getpid():
+        _listener.stop()
+        _listener = None
+        _listener_pid = None
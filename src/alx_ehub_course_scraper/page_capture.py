@@ -0,0 +1,111 @@
+"""
+Page capture helpers
+Saves page snapshots for offline analysis without the page_source round-trip
+"""
+import gzip
+import base64
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+# Screenshots and file writes run here so callers can overlap them with
+# other capture work (and with driving the browser)
+_capture_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="page-capture")
+
+# Longest a caller should wait on save_screenshot_async before giving up, in seconds
+SCREENSHOT_TIMEOUT = 30
+
+def _write_gzip_text(path: Path, text: str, newline: Optional[str] = None):
+    """Write text gzip-compressed at the fastest level, logging failures"""
+    try:
+        # Level 1 is several times faster than the default and still shrinks HTML ~5x
+        with gzip.open(path, "wt", encoding="utf-8", newline=newline, compresslevel=1) as f:
+            f.write(text)
+    except OSError as e:
+        logger.warning(f"Failed to write {path}: {e}")
+
+def save_page_snapshot(driver: WebDriver, base_path: Path) -> Path:
+    """
+    Save the current page to disk, gzip-compressed
+    
+    Chromium drivers capture an MHTML snapshot through CDP, which the
+    browser serializes itself (HTML plus inlined resources). Other drivers
+    fall back to page_source.
+    
+    Only the capture happens on the calling thread - the page is already
+    in memory as a string, so compressing and writing it runs in the
+    background and the caller can move on to the next page.
+    
+    Args:
+        driver: Selenium WebDriver
+        base_path: Target path without extension
+    
+    Returns:
+        Path of the file being written (.mhtml.gz or .html.gz)
+    """
+    base_path = Path(base_path)
+    
+    if hasattr(driver, 'execute_cdp_cmd'):
+        try:
+            snapshot = driver.execute_cdp_cmd("Page.captureSnapshot", {"format": "mhtml"})
+            snapshot_file = base_path.with_suffix('.mhtml.gz')
+            # MHTML already uses CRLF line endings - don't translate them
+            _capture_executor.submit(_write_gzip_text, snapshot_file, snapshot['data'], "")
+            return snapshot_file
+        except Exception as e:
+            logger.debug(f"CDP snapshot failed, falling back to page_source: {e}")
+    
+    html_file = base_path.with_suffix('.html.gz')
+    _capture_executor.submit(_write_gzip_text, html_file, driver.page_source)
+    return html_file
+
+def save_screenshot(driver: WebDriver, base_path: Path, quality: int = 60) -> Path:
+    """
+    Save a screenshot of the current page
+    
+    Chromium drivers capture a JPEG through CDP - PNG encoding inside the
+    browser is the slow part of a screenshot. Other drivers save a PNG.
+    
+    Args:
+        driver: Selenium WebDriver
+        base_path: Target path without extension
+        quality: JPEG quality (0-100)
+    
+    Returns:
+        Path of the written file (.jpg or .png)
+    """
+    base_path = Path(base_path)
+    
+    if hasattr(driver, 'execute_cdp_cmd'):
+        try:
+            screenshot = driver.execute_cdp_cmd(
+                "Page.captureScreenshot",
+                {"format": "jpeg", "quality": quality}
+            )
+            screenshot_file = base_path.with_suffix('.jpg')
+            screenshot_file.write_bytes(base64.b64decode(screenshot['data']))
+            return screenshot_file
+        except Exception as e:
+            logger.debug(f"CDP screenshot failed, falling back to PNG: {e}")
+    
+    screenshot_file = base_path.with_suffix('.png')
+    driver.save_screenshot(str(screenshot_file))
+    return screenshot_file
+
+def save_screenshot_async(driver: WebDriver, base_path: Path, quality: int = 60) -> "Future[Path]":
+    """
+    Start a screenshot in the background
+    
+    Call .result() before navigating away, otherwise the capture may show
+    the next page. Pass timeout=SCREENSHOT_TIMEOUT so a stuck capture
+    can't block the caller forever.
+    
+    Returns:
+        Future resolving to the written file path
+    """
+    return _capture_executor.submit(save_screenshot, driver, base_path, quality)
@@ -0,0 +1,5 @@
+"""Shared pytest setup - makes the src layout importable, like run.py does"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
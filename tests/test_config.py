@@ -0,0 +1,53 @@
+"""Tests for the in-process config file cache"""
+import os
+
+import pytest
+
+from alx_ehub_course_scraper.config import Config
+
+@pytest.fixture
+def config(tmp_path):
+    """Config reading from an empty temporary config directory"""
+    cfg = Config()
+    cfg.config_dir = tmp_path
+    return cfg
+
+def test_missing_file_returns_none(config):
+    assert config._load_json("missing.json") is None
+
+def test_unchanged_file_is_parsed_once(config, tmp_path):
+    (tmp_path / "x.json").write_text('{"a": 1}')
+    
+    first = config._load_json("x.json")
+    
+    assert first == {"a": 1}
+    assert config._load_json("x.json") is first
+
+def test_changed_file_is_parsed_again(config, tmp_path):
+    path = tmp_path / "x.json"
+    path.write_text('{"a": 1}')
+    config._load_json("x.json")
+    
+    path.write_text('{"a": 22}')
+    
+    assert config._load_json("x.json") == {"a": 22}
+
+def test_same_size_rewrite_is_detected_by_mtime(config, tmp_path):
+    path = tmp_path / "x.json"
+    path.write_text('{"a": 1}')
+    config._load_json("x.json")
+    
+    path.write_text('{"a": 2}')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert config._load_json("x.json") == {"a": 2}
+
+def test_reload_drops_lazily_loaded_sub_configs(config, tmp_path):
+    config.config_dir = config.base_dir / "config"
+    courses = config.courses_config
+    
+    config.reload()
+    
+    assert "courses_config" not in config.__dict__
+    assert config.courses_config == courses
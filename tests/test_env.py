@@ -0,0 +1,122 @@
+"""Tests for the .env loader"""
+import os
+from unittest import mock
+
+import pytest
+
+from alx_ehub_course_scraper import _env
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Point load_env at a temporary .env and give each test a fresh parse"""
+    path = tmp_path / ".env"
+    monkeypatch.setattr(_env, "_ENV_FILES", (path,))
+    monkeypatch.setattr(_env, "_applied", {})
+    _env.load_env.cache_clear()
+    # load_env writes into os.environ - undo that after each test
+    with mock.patch.dict(os.environ):
+        yield path
+    _env.load_env.cache_clear()
+
+def test_parses_plain_quoted_and_exported_values(env_file, monkeypatch):
+    env_file.write_text(
+        "# comment line\n"
+        "\n"
+        "PLAIN=value\n"
+        "DOUBLE=\"double quoted\"\n"
+        "SINGLE='single quoted'\n"
+        "export EXPORTED=yes\n"
+        "  SPACED  =  padded  \n"
+        "not a variable line\n",
+        encoding="utf-8"
+    )
+    for key in ("PLAIN", "DOUBLE", "SINGLE", "EXPORTED", "SPACED"):
+        monkeypatch.delenv(key, raising=False)
+    
+    values = _env.load_env()
+    
+    assert dict(values) == {
+        "PLAIN": "value",
+        "DOUBLE": "double quoted",
+        "SINGLE": "single quoted",
+        "EXPORTED": "yes",
+        "SPACED": "padded",
+    }
+    assert os.environ["DOUBLE"] == "double quoted"
+
+def test_inline_comments(env_file):
+    env_file.write_text(
+        "UNQUOTED=value # comment\n"
+        "QUOTED=\"value # not a comment\" # comment\n"
+        "HASH_IN_VALUE=abc#def\n",
+        encoding="utf-8"
+    )
+    
+    assert dict(_env.load_env()) == {
+        "UNQUOTED": "value",
+        "QUOTED": "value # not a comment",
+        "HASH_IN_VALUE": "abc#def",
+    }
+
+def test_only_a_matching_quote_pair_is_stripped(env_file):
+    env_file.write_text(
+        "ALX_PASSWORD=pa\"ss'\n"
+        "TRAILING_QUOTE=secret\"\n"
+        "MISMATCHED=\"open'\n"
+        "INNER='it\"s'\n",
+        encoding="utf-8"
+    )
+    
+    assert dict(_env.load_env()) == {
+        "ALX_PASSWORD": "pa\"ss'",
+        "TRAILING_QUOTE": "secret\"",
+        "MISMATCHED": "\"open'",
+        "INNER": "it\"s",
+    }
+
+def test_handles_crlf_line_endings(env_file, monkeypatch):
+    env_file.write_bytes(b"FIRST=one\r\nSECOND=two\r\n")
+    monkeypatch.delenv("FIRST", raising=False)
+    monkeypatch.delenv("SECOND", raising=False)
+    
+    assert dict(_env.load_env()) == {"FIRST": "one", "SECOND": "two"}
+
+def test_existing_environment_wins(env_file, monkeypatch):
+    env_file.write_text("ALX_TEST_OVERRIDE=from_file\n", encoding="utf-8")
+    monkeypatch.setenv("ALX_TEST_OVERRIDE", "from_env")
+    
+    values = _env.load_env()
+    
+    assert values["ALX_TEST_OVERRIDE"] == "from_file"
+    assert os.environ["ALX_TEST_OVERRIDE"] == "from_env"
+
+def test_missing_file_returns_empty_mapping(env_file):
+    assert dict(_env.load_env()) == {}
+
+def test_file_is_read_once(env_file, monkeypatch):
+    env_file.write_text("ALX_TEST_ONCE=first\n", encoding="utf-8")
+    monkeypatch.delenv("ALX_TEST_ONCE", raising=False)
+    first = _env.load_env()
+    
+    env_file.write_text("ALX_TEST_ONCE=second\n", encoding="utf-8")
+    
+    assert _env.load_env() is first
+    assert first["ALX_TEST_ONCE"] == "first"
+
+def test_reload_updates_values_read_from_the_file(env_file, monkeypatch):
+    for key in ("ALX_TEST_EDITED", "ALX_TEST_REMOVED", "ALX_TEST_REAL"):
+        monkeypatch.delenv(key, raising=False)
+    env_file.write_text(
+        "ALX_TEST_EDITED=first\nALX_TEST_REMOVED=gone\nALX_TEST_REAL=from_file\n",
+        encoding="utf-8"
+    )
+    _env.load_env()
+    monkeypatch.setenv("ALX_TEST_REAL", "from_env")
+    
+    env_file.write_text("ALX_TEST_EDITED=second\nALX_TEST_REAL=edited\n", encoding="utf-8")
+    values = _env.reload_env()
+    
+    assert values["ALX_TEST_EDITED"] == "second"
+    assert os.environ["ALX_TEST_EDITED"] == "second"
+    assert "ALX_TEST_REMOVED" not in os.environ
+    assert os.environ["ALX_TEST_REAL"] == "from_env"
@@ -0,0 +1,51 @@
+"""Tests for the logging setup"""
+import logging
+
+import pytest
+
+from alx_ehub_course_scraper import logging_setup
+from alx_ehub_course_scraper.logging_setup import ConsoleFormatter, setup_logging, shutdown_logging
+
+@pytest.fixture
+def isolated(tmp_path, monkeypatch):
+    """Let a test call setup_logging in a temporary directory and undo it afterwards"""
+    monkeypatch.chdir(tmp_path)
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    yield
+    shutdown_logging()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+def _record(**extra):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    record.__dict__.update(extra)
+    return record
+
+def test_console_formatter_prints_ui_records_bare():
+    formatter = ConsoleFormatter('%(levelname)s - %(message)s')
+    
+    assert formatter.format(_record(ui="✅")) == "✅ hello world"
+    assert formatter.format(_record()) == "INFO - hello world"
+
+def test_setup_is_idempotent(isolated):
+    setup_logging("test")
+    handlers = logging.getLogger().handlers[:]
+    
+    assert setup_logging("other") is logging.getLogger("other")
+    assert logging.getLogger().handlers == handlers
+
+def test_ui_lines_reach_the_console_before_the_next_print(isolated, capsys):
+    # Set up inside the test so the console handler binds the captured stdout
+    setup_logging("test").info("status", extra={'ui': "🔑"})
+    print("prompt")
+    
+    assert capsys.readouterr().out.endswith("🔑 status\nprompt\n")
+
+def test_shutdown_allows_a_fresh_setup(isolated):
+    setup_logging("test")
+    shutdown_logging()
+    
+    assert logging_setup._listener is None
+    setup_logging("test")
+    assert logging_setup._listener is not None
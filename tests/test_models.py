@@ -0,0 +1,73 @@
+"""Tests for the course models"""
+import orjson
+
+from alx_ehub_course_scraper.courses.models import Course, CourseList, Platform
+
+def test_course_id_from_name():
+    assert Course("Data Analytics - Intro").course_id == "data_analytics___intro"
+    assert Course("Python", course_id="custom").course_id == "custom"
+
+def test_relative_link_uses_platform_base():
+    course = Course("Python", platform=Platform.ATHENA, button_link="/courses/1")
+    assert course.full_url == "https://ehub.alxafrica.com/courses/1"
+    
+    savannah = Course("Foundations", platform=Platform.SAVANNAH, button_link="/curriculums/2/")
+    assert savannah.full_url == "https://savannah.alxafrica.com/curriculums/2/"
+
+def test_absolute_and_missing_links():
+    assert Course("A", button_link="https://example.com/a").full_url == "https://example.com/a"
+    assert Course("B", button_link="courses/3").full_url == "courses/3"
+    assert Course("C").full_url is None
+    assert Course("D", button_link="").full_url is None
+
+def test_is_accessible():
+    assert Course("A", button_link="/courses/1").is_accessible
+    assert not Course("B").is_accessible
+    assert not Course("C", button_link="#").is_accessible
+    assert not Course("D", button_link="javascript:void(0)").is_accessible
+
+def test_links_follow_fields_set_after_construction():
+    # Discovery assigns platform and button_link after the Course exists
+    course = Course("Foundations", button_link="/x")
+    assert course.full_url == "https://ehub.alxafrica.com/x"
+    
+    course.platform = Platform.SAVANNAH
+    assert course.full_url == "https://savannah.alxafrica.com/x"
+    
+    course.button_link = "#"
+    assert not course.is_accessible
+    assert course.full_url == "#"
+
+def test_course_list_to_dict_counts():
+    courses = CourseList([
+        Course("A", platform=Platform.ATHENA, button_link="/a", status="Completed"),
+        Course("B", platform=Platform.SAVANNAH, status="In Progress"),
+        Course("C", platform=Platform.DASHBOARD, button_link="/c"),
+    ])
+    
+    data = courses.to_dict()
+    
+    assert data['total_courses'] == 3
+    assert data['accessible_courses'] == 2
+    assert data['by_platform'] == {'athena': 1, 'savannah': 1}
+    assert [c['name'] for c in data['courses']] == ["A", "B", "C"]
+    assert 'icon_svg' not in data['courses'][0]
+    assert courses.summary() == {'total': 3, 'accessible': 2, 'Completed': 1, 'In Progress': 1}
+
+def test_save_to_file_round_trips(tmp_path):
+    path = tmp_path / "courses.json"
+    CourseList([Course("A", button_link="/a")]).save_to_file(path)
+    
+    data = orjson.loads(path.read_bytes())
+    
+    assert data['courses'][0]['full_url'] == "https://ehub.alxafrica.com/a"
+
+def test_save_to_file_writes_icons_only_when_asked(tmp_path):
+    path = tmp_path / "courses.json"
+    courses = CourseList([Course("A", icon_svg="<svg/>")])
+    
+    courses.save_to_file(path)
+    assert 'icon_svg' not in orjson.loads(path.read_bytes())['courses'][0]
+    
+    courses.save_to_file(path, include_heavy=True)
+    assert orjson.loads(path.read_bytes())['courses'][0]['icon_svg'] == "<svg/>"
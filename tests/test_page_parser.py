@@ -0,0 +1,95 @@
+"""Tests for the page_source course parser"""
+from alx_ehub_course_scraper.courses.page_parser import attribute_url, parse_course_containers
+
+BASE_URL = "https://ehub.alxafrica.com"
+
+SELECTORS = {
+    'primary': ".name-mobile",
+    'secondary': ".name-desktop span",
+    'description': "p.description",
+    'metadata': ".meta",
+    'badge': ".badge",
+    'icon': "svg",
+}
+
+PAGE = """
+<html><body>
+  <div class="course">
+    <svg hidden><path d="hidden"/></svg>
+    <svg class="icon"><path d="shown"/></svg>
+    <div class="name-mobile">
+      Python Basics
+    </div>
+    <p class="description">Learn Python</p>
+    <span class="meta">1 Jan 2024</span><span class="meta">12 weeks</span>
+    <span class="badge">Completed</span>
+    <a href="/courses/1"><button data-url="/courses/1/start">Continue</button></a>
+  </div>
+  <div class="course">
+    <div class="name-desktop"><span>Data Science</span></div>
+    <button onclick="window.location='/courses/2'">Start</button>
+  </div>
+  <div class="course"></div>
+</body></html>
+"""
+
+def test_parses_containers_in_page_order():
+    containers = parse_course_containers(PAGE, "div.course", SELECTORS, BASE_URL)
+    
+    assert len(containers) == 3
+    first, second, empty = containers
+    
+    assert first['primary'] == "Python Basics"
+    assert first['secondary'] is None
+    assert first['description'] == "Learn Python"
+    assert first['metadata'] == ["1 Jan 2024", "12 weeks"]
+    assert first['badges'] == ["Completed"]
+    assert first['firstButtonText'] == "Continue"
+    assert first['button'] == {
+        'text': "Continue",
+        'url': "https://ehub.alxafrica.com/courses/1/start",
+        'onclick': None,
+        'parentHref': "https://ehub.alxafrica.com/courses/1",
+    }
+    assert 'shown' in first['icon']
+    
+    assert second['primary'] is None
+    assert second['secondary'] == "Data Science"
+    assert second['button']['url'] is None
+    assert second['button']['onclick'] == "window.location='/courses/2'"
+    assert second['button']['parentHref'] is None
+    
+    assert empty['button'] is None
+    assert empty['icon'] is None
+    assert empty['spans'] == []
+
+def test_icon_not_read_without_selector():
+    selectors = dict(SELECTORS, icon=None)
+    
+    containers = parse_course_containers(PAGE, "div.course", selectors, BASE_URL)
+    
+    assert containers[0]['icon'] is None
+
+def test_invalid_field_selector_counts_as_no_match():
+    selectors = dict(SELECTORS, description="p[")
+    
+    containers = parse_course_containers(PAGE, "div.course", selectors, BASE_URL)
+    
+    assert containers[0]['description'] is None
+
+def test_attribute_url_prefers_well_known_attributes():
+    attrs = {'data-foo': "/other", 'data-url': "/preferred"}
+    
+    assert attribute_url(attrs, BASE_URL) == "https://ehub.alxafrica.com/preferred"
+
+def test_attribute_url_keyword_names_and_url_values():
+    # URL-ish name needs a non-trivial value; the value is stripped
+    assert attribute_url({'data-course-link': "  courses/7  "}, BASE_URL) == "courses/7"
+    assert attribute_url({'data-link': "#"}, BASE_URL) is None
+    # Any attribute whose value looks like a link
+    assert attribute_url({'data-x': "https://example.com/a"}, BASE_URL) == "https://example.com/a"
+    assert attribute_url({'data-x': "./relative"}, BASE_URL) == "./relative"
+
+def test_attribute_url_without_candidates():
+    assert attribute_url({'class': "btn primary", 'type': "button"}, BASE_URL) is None
+    assert attribute_url({}, BASE_URL) is None
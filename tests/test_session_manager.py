@@ -0,0 +1,88 @@
+"""Tests for SessionManager session listing"""
+import os
+
+import orjson
+import pytest
+
+from alx_ehub_course_scraper.auth.login_manager import SessionManager
+
+def write_metadata(user_dir, email, mtime_ns=None):
+    """Write a metadata.json for email, optionally pinning its mtime"""
+    user_dir.mkdir(parents=True, exist_ok=True)
+    metadata_file = user_dir / "metadata.json"
+    metadata_file.write_bytes(orjson.dumps({'email': email, 'last_used': "2024-01-01T00:00:00"}))
+    if mtime_ns is not None:
+        os.utime(metadata_file, ns=(mtime_ns, mtime_ns))
+    return metadata_file
+
+@pytest.fixture
+def manager(tmp_path):
+    return SessionManager(base_dir=tmp_path / "sessions")
+
+def test_lists_sessions_sorted_by_user_dir(manager):
+    write_metadata(manager.base_dir / "b_user", "b@example.com")
+    write_metadata(manager.base_dir / "a_user", "a@example.com")
+    (manager.base_dir / "no_metadata").mkdir()
+    (manager.base_dir / "stray.txt").write_text("not a session dir")
+    
+    sessions = manager.list_sessions()
+    
+    assert [s['email'] for s in sessions] == ["a@example.com", "b@example.com"]
+
+def test_unchanged_metadata_is_served_from_cache(manager):
+    user_dir = manager.base_dir / "a_user"
+    metadata_file = write_metadata(user_dir, "a@example.com", mtime_ns=1_000_000_000)
+    assert manager.list_sessions()[0]['email'] == "a@example.com"
+    
+    # Same mtime - the file is not parsed again
+    metadata_file.write_bytes(orjson.dumps({'email': "changed@example.com"}))
+    os.utime(metadata_file, ns=(1_000_000_000, 1_000_000_000))
+    
+    assert manager.list_sessions()[0]['email'] == "a@example.com"
+
+def test_modified_metadata_is_reparsed(manager):
+    user_dir = manager.base_dir / "a_user"
+    write_metadata(user_dir, "a@example.com", mtime_ns=1_000_000_000)
+    manager.list_sessions()
+    
+    write_metadata(user_dir, "new@example.com", mtime_ns=2_000_000_000)
+    
+    assert manager.list_sessions()[0]['email'] == "new@example.com"
+
+def test_removed_and_unreadable_metadata_are_skipped(manager):
+    removed = write_metadata(manager.base_dir / "a_user", "a@example.com")
+    broken = manager.base_dir / "b_user" / "metadata.json"
+    broken.parent.mkdir()
+    broken.write_bytes(b"{not json")
+    assert [s['email'] for s in manager.list_sessions()] == ["a@example.com"]
+    
+    removed.unlink()
+    
+    assert manager.list_sessions() == []
+    assert removed not in manager._metadata_cache
+
+class FakeDriver:
+    """Just enough of a WebDriver for save_session"""
+    def get_cookies(self):
+        return [{'name': "session", 'value': "abc"}]
+
+def test_save_session_replaces_without_archiving_by_default(manager):
+    manager.save_session(FakeDriver(), "a@example.com")
+    manager.save_session(FakeDriver(), "a@example.com")
+    
+    user_dir = manager._get_user_dir("a@example.com")
+    assert sorted(p.name for p in user_dir.iterdir()) == ["metadata.json", "session.json"]
+
+def test_archiving_keeps_only_the_newest_archives(tmp_path):
+    manager = SessionManager(base_dir=tmp_path / "sessions", archive=True, max_archives=2)
+    user_dir = manager._get_user_dir("a@example.com")
+    for stamp in ("20240101_000000", "20240102_000000", "20240103_000000"):
+        (user_dir / f"session_{stamp}.json").write_bytes(b"[]")
+    manager.save_session(FakeDriver(), "a@example.com")
+    
+    manager.save_session(FakeDriver(), "a@example.com")
+    
+    archives = sorted(p.name for p in user_dir.glob("session_*.json"))
+    assert len(archives) == 2
+    assert archives[0] == "session_20240103_000000.json"
+    assert (user_dir / "session.json").exists()